@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 
@@ -25,24 +26,36 @@ def force_install(package):
     except subprocess.CalledProcessError as e:
         print(f"{package} 설치 실패: {e}")
 
-for package in required_packages:
-    print(f"{package} 설치 또는 업데이트 중...")
-    force_install(package)
+if os.getenv("SKIP_PACKAGE_INSTALL") != "1":
+    for package in required_packages:
+        print(f"{package} 설치 또는 업데이트 중...")
+        force_install(package)
 
 
 import asyncio
 import csv
+import functools
+import hashlib
 import io
 import json
 import logging
-import os
+import multiprocessing
 import random
 import re
-import urllib.request
-from dataclasses import dataclass, field
+import sqlite3
+import string
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Iterable, Optional
 
 import aiohttp
 import discord
@@ -83,9 +96,29 @@ CHALLONGE_CLIENT_SECRET = os.getenv("CHALLONGE_CLIENT_SECRET")
 CHALLONGE_API_KEY = os.getenv("CHALLONGE_API_KEY")
 CHALLONGE_API_BASE = os.getenv("CHALLONGE_API_BASE", "https://api.challonge.com/v1")
 CHALLONGE_TOKEN_URL = os.getenv("CHALLONGE_TOKEN_URL", "https://api.challonge.com/oauth/token")
+CHALLONGE_POOL_LIMIT = int(os.getenv("CHALLONGE_POOL_LIMIT", "20"))
+CHALLONGE_POOL_LIMIT_PER_HOST = int(os.getenv("CHALLONGE_POOL_LIMIT_PER_HOST", "10"))
+CHALLONGE_DNS_TTL = int(os.getenv("CHALLONGE_DNS_TTL", "300"))
+CHALLONGE_KEEPALIVE_TIMEOUT = float(os.getenv("CHALLONGE_KEEPALIVE_TIMEOUT", "30"))
+CHALLONGE_RATE_PER_SECOND = float(os.getenv("CHALLONGE_RATE_PER_SECOND", "2"))
+CHALLONGE_RATE_BURST = int(os.getenv("CHALLONGE_RATE_BURST", "10"))
+CHALLONGE_MAX_RETRIES = int(os.getenv("CHALLONGE_MAX_RETRIES", "3"))
+CHALLONGE_BACKOFF_BASE = float(os.getenv("CHALLONGE_BACKOFF_BASE", "0.5"))
+CHALLONGE_BACKOFF_MAX = float(os.getenv("CHALLONGE_BACKOFF_MAX", "8"))
+CHALLONGE_ENDPOINT_CONCURRENCY = int(os.getenv("CHALLONGE_ENDPOINT_CONCURRENCY", "4"))
+CHALLONGE_RETRY_STATUSES = {429, 500, 502, 503, 504}
+CHALLONGE_TRANSIENT_CLIENT_STATUSES = {401, 408, 429}
+CHALLONGE_PARTICIPANTS_TTL = float(os.getenv("CHALLONGE_PARTICIPANTS_TTL", "300"))
+CHALLONGE_MATCHES_TTL = float(os.getenv("CHALLONGE_MATCHES_TTL", "15"))
+CHALLONGE_STALE_WHILE_REVALIDATE = os.getenv("CHALLONGE_STALE_WHILE_REVALIDATE", "1") == "1"
+CHALLONGE_MAX_STALE = float(os.getenv("CHALLONGE_MAX_STALE", "3600"))
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", "2"))
+THUMBNAIL_QUEUE_LIMIT = int(os.getenv("THUMBNAIL_QUEUE_LIMIT", "8"))
+AUTOCOMPLETE_BUDGET = float(os.getenv("AUTOCOMPLETE_BUDGET", "2"))
+AUTOCOMPLETE_RECENT_LIMIT = int(os.getenv("AUTOCOMPLETE_RECENT_LIMIT", "256"))
 KST = timezone(timedelta(hours=9))
 KST_FONT_URL = "https://github.com/google/fonts/raw/main/ofl/dohyeon/DoHyeon-Regular.ttf"
-KST_FONT_PATH = Path(__file__).parent / "data" / "DoHyeon-Regular.ttf"
+KST_FONT_NAME = "DoHyeon-Regular.ttf"
 
 INTRO_EMBED = discord.Embed(
     title="크즈흐 봇",
@@ -127,6 +160,258 @@ class ThreadBinding:
     category: str
 
 
+@dataclass
+class ChallongeResponse:
+    status: int
+    data: object = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def rejected(self) -> bool:
+        return 400 <= self.status < 500 and self.status not in CHALLONGE_TRANSIENT_CLIENT_STATUSES
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+CHALLONGE_PATH_ID_RE = re.compile(r"/(?!tournaments\b|matches\b|participants\b)[^/]+")
+
+
+def challonge_endpoint_key(method: str, path: str) -> str:
+    return f"{method.upper()} {CHALLONGE_PATH_ID_RE.sub('/:id', path)}"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class ChallongeClient:
+    def __init__(
+        self,
+        *,
+        limit: int = CHALLONGE_POOL_LIMIT,
+        limit_per_host: int = CHALLONGE_POOL_LIMIT_PER_HOST,
+        dns_ttl: int = CHALLONGE_DNS_TTL,
+        keepalive_timeout: float = CHALLONGE_KEEPALIVE_TIMEOUT,
+        rate_per_second: float = CHALLONGE_RATE_PER_SECOND,
+        rate_burst: int = CHALLONGE_RATE_BURST,
+        max_retries: int = CHALLONGE_MAX_RETRIES,
+        endpoint_concurrency: int = CHALLONGE_ENDPOINT_CONCURRENCY,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token: Optional[str] = None
+        self._token_expiry: Optional[datetime] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self.limiter = TokenBucket(rate_per_second, rate_burst)
+        self.max_retries = max_retries
+        self.endpoint_concurrency = endpoint_concurrency
+        self._endpoint_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=20))
+        return self._session
+
+    async def open(self) -> None:
+        _ = self.session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def reset_token(self) -> None:
+        self._token = None
+        self._token_expiry = None
+
+    async def get_token(self) -> Optional[str]:
+        if not CHALLONGE_CLIENT_SECRET or not CHALLONGE_CLIENT_ID:
+            return None
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if self._token and self._token_expiry and datetime.now(timezone.utc) < self._token_expiry:
+                return self._token
+            payload = {
+                "grant_type": "client_credentials",
+                "client_id": CHALLONGE_CLIENT_ID,
+                "client_secret": CHALLONGE_CLIENT_SECRET,
+            }
+            timeout = aiohttp.ClientTimeout(total=15)
+            async with self.session.post(CHALLONGE_TOKEN_URL, data=payload, timeout=timeout) as response:
+                if response.status >= 400:
+                    body = await response.text()
+                    logger.error("Failed to fetch Challonge token: %s %s", response.status, body)
+                    return None
+                data = await response.json()
+            token = data.get("access_token")
+            expires_in = int(data.get("expires_in", 3600))
+            if token:
+                self._token = token
+                self._token_expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in - 30)
+            return token
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict[str, str]] = None,
+        json_body: Optional[dict] = None,
+    ) -> Optional[dict]:
+        response = await self.fetch(method, path, params=params, json_body=json_body)
+        return response.data if response else None
+
+    async def fetch(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict[str, str]] = None,
+        json_body: Optional[dict] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[ChallongeResponse]:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        params = params.copy() if params else {}
+        if CHALLONGE_API_KEY:
+            params["api_key"] = CHALLONGE_API_KEY
+            params.setdefault("format", "json")
+        else:
+            token = await self.get_token()
+            if not token:
+                logger.warning("Challonge token unavailable.")
+                return None
+            headers["Authorization"] = f"Bearer {token}"
+            headers["Accept"] = "application/json"
+        url = f"{CHALLONGE_API_BASE}{path}"
+        endpoint = challonge_endpoint_key(method, path)
+        for attempt in range(self.max_retries + 1):
+            self.stats["requests"] += 1
+            retry_after: Optional[float] = None
+            async with self._endpoint_semaphore(endpoint):
+                waited = await self.limiter.acquire()
+                if waited:
+                    self.stats["limiter_waits"] += 1
+                try:
+                    async with self.session.request(
+                        method, url, headers=headers, params=params, json=json_body
+                    ) as response:
+                        result = ChallongeResponse(
+                            status=response.status,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+                        if response.status == 304:
+                            return result
+                        if response.status in CHALLONGE_RETRY_STATUSES:
+                            if response.status == 429:
+                                self.stats["throttled"] += 1
+                            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                            body = await response.text()
+                            logger.warning(
+                                "Challonge request %s %s returned %s (attempt %s): %s",
+                                method, url, response.status, attempt + 1, body[:200],
+                            )
+                        elif response.status >= 400:
+                            body = await response.text()
+                            self.stats["failures"] += 1
+                            logger.error("Challonge request failed %s %s: %s", method, url, body)
+                            result.error = body[:500]
+                            return result
+                        else:
+                            try:
+                                result.data = await response.json(content_type=None)
+                            except (aiohttp.ContentTypeError, json.JSONDecodeError):
+                                body = await response.text()
+                                logger.error("Challonge returned non-JSON payload: %s", body)
+                                self.stats["failures"] += 1
+                                return None
+                            return result
+                except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                    self.stats["errors"] += 1
+                    logger.warning("Challonge request %s %s raised %r (attempt %s)", method, url, error, attempt + 1)
+            if attempt == self.max_retries:
+                break
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+        self.stats["failures"] += 1
+        logger.error("Challonge request %s %s failed after %s attempts.", method, url, self.max_retries + 1)
+        return None
+
+    def _endpoint_semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        semaphore = self._endpoint_semaphores.get(endpoint)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.endpoint_concurrency)
+            self._endpoint_semaphores[endpoint] = semaphore
+        return semaphore
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        cap = min(CHALLONGE_BACKOFF_MAX, CHALLONGE_BACKOFF_BASE * (2 ** attempt))
+        delay = random.uniform(0, cap)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
 class ModerationBot(commands.Bot):
     def __init__(self) -> None:
         intents = discord.Intents.default()
@@ -135,8 +420,22 @@ class ModerationBot(commands.Bot):
         intents.dm_messages = True
         super().__init__(command_prefix="!", intents=intents)
         self.user_threads: dict[int, ThreadBinding] = {}
+        self.challonge = ChallongeClient()
 
     async def setup_hook(self) -> None:
+        await asyncio.to_thread(thumbnail_assets.preload)
+        await thumbnail_pool.start()
+        thumbnail_cache.load()
+        persistence.start()
+        warm_entries = challonge_disk_cache.load()
+        if warm_entries:
+            logger.info("Loaded %s Challonge cache entries from disk.", warm_entries)
+        await self.challonge.open()
+        tour_logo_cache.load()
+        if bot_config.tour_logo and tour_logo_cache.get(bot_config.tour_logo) is None:
+            tour_logo_cache.refresh(bot_config.tour_logo)
+        challonge_outbox.start()
+        bracket_poller.start()
         logger.info("Starting command registry reset and sync.")
         try:
             await clear_all_command_registries()
@@ -148,14 +447,56 @@ class ModerationBot(commands.Bot):
             except Exception:
                 logger.exception("Failed to sync commands for guild %s", guild_id)
 
+    async def close(self) -> None:
+        try:
+            await super().close()
+        finally:
+            await bracket_poller.stop()
+            await challonge_disk_cache.close()
+            await challonge_outbox.stop()
+            challonge_outbox.close()
+            await tour_logo_cache.close()
+            await self.challonge.close()
+            await persistence.stop()
+            event_storage.close()
+            thumbnail_pool.close()
+
 
 bot = ModerationBot()
 
-DATA_DIR = Path(__file__).parent / "data"
-DATA_DIR.mkdir(exist_ok=True)
+DATA_DIR = Path(os.getenv("TOURNAMENT_DATA_DIR", Path(__file__).parent / "data"))
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 CONFIG_PATH = DATA_DIR / "config.json"
 EVENTS_PATH = DATA_DIR / "events.json"
+EVENTS_DB_PATH = DATA_DIR / "events.sqlite3"
+EVENT_STORE_BACKEND = os.getenv("EVENT_STORE_BACKEND", "sqlite").lower()
+PERSIST_COALESCE_MS = int(os.getenv("PERSIST_COALESCE_MS", "250"))
+PERSIST_RETRY_MAX = float(os.getenv("PERSIST_RETRY_MAX", "60"))
+EVENTS_SNAPSHOT_PATH = DATA_DIR / "events.snapshot.json"
+EVENTS_JOURNAL_PATH = DATA_DIR / "events.journal.jsonl"
+EVENT_JOURNAL_COMPACT_EVERY = int(os.getenv("EVENT_JOURNAL_COMPACT_EVERY", "500"))
+ARCHIVE_DIR = DATA_DIR / "archive"
+OUTBOX_DB_PATH = DATA_DIR / "challonge_outbox.sqlite3"
+CHALLONGE_CACHE_PATH = DATA_DIR / "challonge_cache.json"
+TOUR_LOGO_PATH = DATA_DIR / "tour_logo.png"
+THUMBNAIL_CACHE_DIR = DATA_DIR / "thumbnails"
+THUMBNAIL_MEMORY_CACHE_BYTES = int(os.getenv("THUMBNAIL_MEMORY_CACHE_BYTES", str(64 * 1024 * 1024)))
+THUMBNAIL_DISK_CACHE_BYTES = int(os.getenv("THUMBNAIL_DISK_CACHE_BYTES", str(512 * 1024 * 1024)))
+TOUR_LOGO_META_PATH = DATA_DIR / "tour_logo.json"
+TOUR_LOGO_SIZE = (300, 300)
+TOUR_LOGO_MAX_BYTES = int(os.getenv("TOUR_LOGO_MAX_BYTES", str(10 * 1024 * 1024)))
+TOUR_LOGO_FETCH_TIMEOUT = float(os.getenv("TOUR_LOGO_FETCH_TIMEOUT", "5"))
+TOUR_LOGO_RETRY_INTERVAL = float(os.getenv("TOUR_LOGO_RETRY_INTERVAL", "300"))
+CHALLONGE_CACHE_SAVE_DELAY = float(os.getenv("CHALLONGE_CACHE_SAVE_DELAY", "5"))
+CHALLONGE_WARM_CACHE_MAX_AGE = float(os.getenv("CHALLONGE_WARM_CACHE_MAX_AGE", "86400"))
+BRACKET_POLL_MIN_INTERVAL = float(os.getenv("BRACKET_POLL_MIN_INTERVAL", "15"))
+BRACKET_POLL_MAX_INTERVAL = float(os.getenv("BRACKET_POLL_MAX_INTERVAL", "180"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "30"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "10"))
+JOURNAL_ARCHIVE_DIR = ARCHIVE_DIR / "journal"
 BACKGROUND_DIR = Path(__file__).parent / "background"
+FONT_DIR = Path(__file__).parent / "fonts"
+THUMBNAIL_FONT_PATH = os.getenv("THUMBNAIL_FONT_PATH")
 COMMAND_LOG_PATH = DATA_DIR / "command_log.txt"
 SCHEDULE_LOG_PATH = DATA_DIR / "schedule_log.txt"
 CAPTAINS_CSV_PATH = DATA_DIR / "captains.csv"
@@ -173,6 +514,7 @@ class BotConfig:
     thumbnail_channel: Optional[int] = None
     tour_logo: Optional[str] = None
     challonge_tournament: Optional[str] = None
+    challonge_tournaments: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -193,24 +535,557 @@ def load_config() -> BotConfig:
     return BotConfig()
 
 
-def save_config(config: BotConfig) -> None:
-    CONFIG_PATH.write_text(json.dumps(config.__dict__, ensure_ascii=False, indent=2), encoding="utf-8")
+def write_atomic(path: Path, content: str | bytes) -> None:
+    path.parent.mkdir(exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with (temp_path.open("wb") if isinstance(content, bytes) else temp_path.open("w", encoding="utf-8")) as handle:
+        handle.write(content)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+    if os.name == "posix":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def write_config(config: dict) -> None:
+    write_atomic(CONFIG_PATH, json.dumps(config, ensure_ascii=False, indent=2))
+
+
+class EventStore(ABC):
+    records_mutations = False
+
+    @abstractmethod
+    def load(self) -> dict[str, EventData]:
+        ...
+
+    @abstractmethod
+    def upsert(self, event: EventData) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, title: str) -> None:
+        ...
+
+    @abstractmethod
+    def replace_all(self, events: dict[str, EventData]) -> None:
+        ...
+
+    def apply(self, upserts: list[EventData], deletes: list[str], records: list[dict]) -> None:
+        for event in upserts:
+            self.upsert(event)
+        for title in deletes:
+            self.delete(title)
+
+    def archive(self, label: str) -> Path:
+        payload = {title: dict(event.__dict__) for title, event in self.load().items()}
+        archive_path = ARCHIVE_DIR / f"season_{label}.json"
+        write_atomic(archive_path, json.dumps(payload, ensure_ascii=False))
+        return archive_path
+
+    def close(self) -> None:
+        pass
+
+
+class JsonEventStore(EventStore):
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._payload: dict[str, dict] = {}
+
+    def load(self) -> dict[str, EventData]:
+        if not self.path.exists():
+            self._payload = {}
+            return {}
+        self._payload = json.loads(self.path.read_text(encoding="utf-8"))
+        return {key: EventData(**value) for key, value in self._payload.items()}
+
+    def _write(self) -> None:
+        write_atomic(self.path, json.dumps(self._payload, ensure_ascii=False, indent=2))
+
+    def upsert(self, event: EventData) -> None:
+        self._payload[event.title] = dict(event.__dict__)
+        self._write()
+
+    def delete(self, title: str) -> None:
+        if self._payload.pop(title, None) is not None:
+            self._write()
+
+    def replace_all(self, events: dict[str, EventData]) -> None:
+        self._payload = {key: dict(event.__dict__) for key, event in events.items()}
+        self._write()
+
+    def apply(self, upserts: list[EventData], deletes: list[str], records: list[dict]) -> None:
+        for event in upserts:
+            self._payload[event.title] = dict(event.__dict__)
+        for title in deletes:
+            self._payload.pop(title, None)
+        self._write()
+
+
+class SqliteEventStore(EventStore):
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                title TEXT PRIMARY KEY,
+                challonge_match_id TEXT,
+                schedule_message_id INTEGER,
+                schedule_channel_id INTEGER,
+                scheduled_event_id INTEGER,
+                judge_id INTEGER,
+                recorder_id INTEGER,
+                details TEXT NOT NULL DEFAULT '{}'
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_challonge_match_id ON events (challonge_match_id)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _row(event: EventData) -> tuple:
+        details = event.details or {}
+        return (
+            event.title,
+            details.get("challonge_match_id"),
+            event.schedule_message_id,
+            event.schedule_channel_id,
+            event.scheduled_event_id,
+            event.judge_id,
+            event.recorder_id,
+            json.dumps(details, ensure_ascii=False),
+        )
+
+    def load(self) -> dict[str, EventData]:
+        rows = self._conn.execute(
+            "SELECT title, schedule_message_id, schedule_channel_id, scheduled_event_id, "
+            "judge_id, recorder_id, details FROM events"
+        ).fetchall()
+        events = {}
+        for title, message_id, channel_id, scheduled_id, judge_id, recorder_id, details in rows:
+            events[title] = EventData(
+                title=title,
+                schedule_message_id=message_id,
+                schedule_channel_id=channel_id,
+                scheduled_event_id=scheduled_id,
+                judge_id=judge_id,
+                recorder_id=recorder_id,
+                details=json.loads(details or "{}"),
+            )
+        return events
+
+    def upsert(self, event: EventData) -> None:
+        self.apply([event], [], [])
+
+    def apply(self, upserts: list[EventData], deletes: list[str], records: list[dict]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO events (
+                    title, challonge_match_id, schedule_message_id, schedule_channel_id,
+                    scheduled_event_id, judge_id, recorder_id, details
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(title) DO UPDATE SET
+                    challonge_match_id = excluded.challonge_match_id,
+                    schedule_message_id = excluded.schedule_message_id,
+                    schedule_channel_id = excluded.schedule_channel_id,
+                    scheduled_event_id = excluded.scheduled_event_id,
+                    judge_id = excluded.judge_id,
+                    recorder_id = excluded.recorder_id,
+                    details = excluded.details
+                """,
+                [self._row(event) for event in upserts],
+            )
+            self._conn.executemany("DELETE FROM events WHERE title = ?", [(title,) for title in deletes])
+
+    def delete(self, title: str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM events WHERE title = ?", (title,))
+
+    def replace_all(self, events: dict[str, EventData]) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM events")
+            self._conn.executemany(
+                "INSERT INTO events (title, challonge_match_id, schedule_message_id, schedule_channel_id, "
+                "scheduled_event_id, judge_id, recorder_id, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(event) for event in events.values()],
+            )
+
+    def is_empty(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM events LIMIT 1").fetchone() is None
+
+    def migrate_from_json(self, path: Path) -> int:
+        if not path.exists() or not self.is_empty():
+            return 0
+        events = JsonEventStore(path).load()
+        self.replace_all(events)
+        path.replace(path.with_name(f"{path.name}.migrated"))
+        logger.info("Migrated %s events from %s to %s", len(events), path, self.path)
+        return len(events)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class JournalEventStore(EventStore):
+    records_mutations = True
+
+    def __init__(self, snapshot_path: Path, journal_path: Path, compact_every: int) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self._state: dict[str, dict] = {}
+        self._journal_records = 0
+
+    def load(self) -> dict[str, EventData]:
+        self._state = {}
+        if self.snapshot_path.exists():
+            self._state = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        self._journal_records = 0
+        if self.journal_path.exists():
+            with self.journal_path.open("r", encoding="utf-8") as handle:
+                for line_no, line in enumerate(handle, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping corrupt journal line %s in %s", line_no, self.journal_path)
+                        continue
+                    self._replay(record)
+                    self._journal_records += 1
+        return {title: EventData(**payload) for title, payload in self._state.items()}
+
+    def _replay(self, record: dict) -> None:
+        title = record.get("title")
+        if not title:
+            return
+        payload = record.get("event")
+        if payload is None:
+            self._state.pop(title, None)
+        else:
+            self._state[title] = payload
+
+    def upsert(self, event: EventData) -> None:
+        self.apply([event], [], [build_journal_record("update", event.title, event)])
+
+    def delete(self, title: str) -> None:
+        self.apply([], [title], [build_journal_record("delete", title, None)])
+
+    def apply(self, upserts: list[EventData], deletes: list[str], records: list[dict]) -> None:
+        if not records:
+            return
+        lines = "".join(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n" for record in records)
+        with self.journal_path.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+            handle.flush()
+            os.fsync(handle.fileno())
+        for record in records:
+            self._replay(record)
+        self._journal_records += len(records)
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        write_atomic(self.snapshot_path, json.dumps(self._state, ensure_ascii=False, separators=(",", ":")))
+        if self.journal_path.exists() and self.journal_path.stat().st_size:
+            JOURNAL_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+            os.replace(self.journal_path, JOURNAL_ARCHIVE_DIR / f"events_{timestamp}.jsonl")
+        self._journal_records = 0
+
+    def replace_all(self, events: dict[str, EventData]) -> None:
+        self._state = {title: dict(event.__dict__) for title, event in events.items()}
+        self.compact()
+
+    def archive(self, label: str) -> Path:
+        self.compact()
+        archive_path = ARCHIVE_DIR / f"season_{label}.json"
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.snapshot_path, archive_path)
+        self._state = {}
+        return archive_path
+
+    def migrate_from_json(self, path: Path) -> int:
+        if not path.exists() or self.snapshot_path.exists() or self.journal_path.exists():
+            return 0
+        events = JsonEventStore(path).load()
+        self.replace_all(events)
+        path.replace(path.with_name(f"{path.name}.migrated"))
+        logger.info("Migrated %s events from %s to %s", len(events), path, self.snapshot_path)
+        return len(events)
+
+    def close(self) -> None:
+        if self._journal_records:
+            self.compact()
+
+
+def create_event_store() -> EventStore:
+    if EVENT_STORE_BACKEND == "json":
+        return JsonEventStore(EVENTS_PATH)
+    if EVENT_STORE_BACKEND == "journal":
+        store = JournalEventStore(EVENTS_SNAPSHOT_PATH, EVENTS_JOURNAL_PATH, EVENT_JOURNAL_COMPACT_EVERY)
+        store.migrate_from_json(EVENTS_PATH)
+        return store
+    if EVENT_STORE_BACKEND != "sqlite":
+        logger.warning("Unknown EVENT_STORE_BACKEND %s; using sqlite.", EVENT_STORE_BACKEND)
+    store = SqliteEventStore(EVENTS_DB_PATH)
+    store.migrate_from_json(EVENTS_PATH)
+    return store
+
+
+event_storage = create_event_store()
 
 
 def load_events() -> dict[str, EventData]:
-    if EVENTS_PATH.exists():
-        raw = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-        return {key: EventData(**value) for key, value in raw.items()}
-    return {}
+    return event_storage.load()
+
+
+def snapshot_event(event: EventData) -> EventData:
+    return replace(event, details=dict(event.details))
+
+
+def build_journal_record(action: str, title: str, event: Optional[EventData], user_id: Optional[int] = None) -> dict:
+    return {
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "action": action,
+        "title": title,
+        "user_id": user_id,
+        "event": dict(snapshot_event(event).__dict__) if event else None,
+    }
+
+
+@dataclass
+class PersistenceBatch:
+    full: Optional[dict[str, EventData]] = None
+    upserts: list[EventData] = field(default_factory=list)
+    deletes: list[str] = field(default_factory=list)
+    records: list[dict] = field(default_factory=list)
+    config: Optional[dict] = None
+
+
+class PersistenceWorker:
+    def __init__(self, events: dict[str, EventData], store: EventStore, delay: float, retry_max: float) -> None:
+        self.events = events
+        self.store = store
+        self.delay = delay
+        self.retry_max = retry_max
+        self._dirty_titles: set[str] = set()
+        self._replace_all = False
+        self._records: list[dict] = []
+        self._config: Optional[BotConfig] = None
+        self._config_dirty = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="persistence-worker")
+        if self.has_pending():
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        if self._task:
+            async with self._flush_lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def has_pending(self) -> bool:
+        return bool(self._dirty_titles) or self._replace_all or self._config_dirty
+
+    def mark_event(self, title: str, action: str = "update", user_id: Optional[int] = None) -> None:
+        self._dirty_titles.add(title)
+        if self.store.records_mutations:
+            self._records.append(build_journal_record(action, title, self.events.get(title), user_id))
+        self._schedule()
+
+    def mark_all_events(self) -> None:
+        self._replace_all = True
+        self._dirty_titles.clear()
+        self._records.clear()
+        self._schedule()
+
+    def mark_config(self, config: BotConfig) -> None:
+        self._config = config
+        self._config_dirty = True
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self.running and self._wakeup:
+            self._wakeup.set()
+        else:
+            self._write(self._take_batch())
+
+    def _take_batch(self) -> PersistenceBatch:
+        batch = PersistenceBatch(records=self._records)
+        if self._replace_all:
+            batch.full = {title: snapshot_event(event) for title, event in self.events.items()}
+        for title in self._dirty_titles:
+            event = self.events.get(title)
+            if event is None:
+                batch.deletes.append(title)
+            else:
+                batch.upserts.append(snapshot_event(event))
+        if self._config_dirty and self._config:
+            batch.config = dict(self._config.__dict__)
+        self._dirty_titles = set()
+        self._replace_all = False
+        self._records = []
+        self._config_dirty = False
+        return batch
+
+    def _write(self, batch: PersistenceBatch) -> None:
+        if batch.full is not None:
+            self.store.replace_all(batch.full)
+        if batch.upserts or batch.deletes:
+            self.store.apply(batch.upserts, batch.deletes, batch.records)
+        if batch.config is not None:
+            write_config(batch.config)
+
+    def _restore(self, batch: PersistenceBatch) -> None:
+        if batch.full is not None:
+            self._replace_all = True
+        self._dirty_titles.update(event.title for event in batch.upserts)
+        self._dirty_titles.update(batch.deletes)
+        self._records[:0] = batch.records
+        if batch.config is not None:
+            self._config_dirty = True
+
+    async def _flush_locked(self) -> None:
+        if not self.has_pending():
+            return
+        batch = self._take_batch()
+        try:
+            await asyncio.to_thread(self._write, batch)
+        except Exception:
+            self._restore(batch)
+            raise
+
+    async def flush(self) -> None:
+        if self._flush_lock is None:
+            self._write(self._take_batch())
+            return
+        async with self._flush_lock:
+            await self._flush_locked()
+
+    async def archive(self, label: str) -> Path:
+        if self._flush_lock is None:
+            self._write(self._take_batch())
+            return self.store.archive(label)
+        async with self._flush_lock:
+            await self._flush_locked()
+            return await asyncio.to_thread(self.store.archive, label)
+
+    async def _run(self) -> None:
+        failures = 0
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.delay)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                failures += 1
+                retry_in = min(self.retry_max, max(1.0, self.delay) * 2 ** (failures - 1))
+                logger.exception("Failed to persist pending changes; retrying in %.0fs.", retry_in)
+                await asyncio.sleep(retry_in)
+                self._wakeup.set()
+            else:
+                failures = 0
+
 
+class EventIndex:
+    def __init__(self) -> None:
+        self.by_match_id: dict[str, str] = {}
+        self.by_schedule_message_id: dict[int, str] = {}
+        self._keys: dict[str, tuple[Optional[str], Optional[int]]] = {}
+
+    @staticmethod
+    def _event_keys(event: EventData) -> tuple[Optional[str], Optional[int]]:
+        match_id = event.details.get("challonge_match_id") if event.details else None
+        return match_id or None, event.schedule_message_id
+
+    def update(self, title: str, event: EventData) -> None:
+        self.remove(title)
+        match_id, message_id = self._event_keys(event)
+        if match_id:
+            self.by_match_id[match_id] = title
+        if message_id:
+            self.by_schedule_message_id[message_id] = title
+        self._keys[title] = (match_id, message_id)
+
+    def remove(self, title: str) -> None:
+        keys = self._keys.pop(title, None)
+        if not keys:
+            return
+        match_id, message_id = keys
+        if match_id and self.by_match_id.get(match_id) == title:
+            del self.by_match_id[match_id]
+        if message_id and self.by_schedule_message_id.get(message_id) == title:
+            del self.by_schedule_message_id[message_id]
 
-def save_events(events: dict[str, EventData]) -> None:
-    payload = {key: event.__dict__ for key, event in events.items()}
-    EVENTS_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    def match_id_for(self, title: str) -> Optional[str]:
+        keys = self._keys.get(title)
+        return keys[0] if keys else None
+
+    def rebuild(self, events: dict[str, EventData]) -> None:
+        self.by_match_id.clear()
+        self.by_schedule_message_id.clear()
+        self._keys.clear()
+        for title, event in events.items():
+            self.update(title, event)
 
 
 bot_config = load_config()
 events_store = load_events()
+event_index = EventIndex()
+event_index.rebuild(events_store)
+persistence = PersistenceWorker(events_store, event_storage, PERSIST_COALESCE_MS / 1000, PERSIST_RETRY_MAX)
+
+
+def save_config(config: BotConfig) -> None:
+    persistence.mark_config(config)
+
+
+def save_events() -> None:
+    event_index.rebuild(events_store)
+    schedulable_matches.rebuild_all()
+    persistence.mark_all_events()
+
+
+def save_event(event: EventData, action: str = "update", user_id: Optional[int] = None) -> None:
+    previous_match_id = event_index.match_id_for(event.title)
+    event_index.update(event.title, event)
+    schedulable_matches.refresh_match_ids(previous_match_id, event_index.match_id_for(event.title))
+    persistence.mark_event(event.title, action, user_id)
+
+
+def delete_event(title: str, user_id: Optional[int] = None) -> None:
+    match_id = event_index.match_id_for(title)
+    event_index.remove(title)
+    schedulable_matches.refresh_match_ids(match_id)
+    persistence.mark_event(title, "delete", user_id)
 
 
 async def sync_guild_commands(guild_id: int) -> list[app_commands.AppCommand]:
@@ -513,24 +1388,351 @@ def build_schedule_embed(title: str, details: dict[str, Optional[str]], event: E
     return embed
 
 
-def get_background_image() -> Image.Image:
-    if BACKGROUND_DIR.exists():
-        images = sorted([path for path in BACKGROUND_DIR.iterdir() if path.suffix.lower() in {".png", ".jpg", ".jpeg"}])
-        if images:
-            image = Image.open(images[0]).convert("RGB")
-            return image.resize((1920, 1080))
-    return Image.new("RGB", (1920, 1080), color=(20, 20, 20))
+THUMBNAIL_SIZE = (1920, 1080)
+THUMBNAIL_FONT_STEP = 10
+THUMBNAIL_RENDER_VERSION = 3
+THUMBNAIL_TEMPLATE_PATH = Path(os.getenv("THUMBNAIL_TEMPLATE_PATH", DATA_DIR / "thumbnail_template.json"))
+THUMBNAIL_TEXT_FIELDS = ("team1", "team2", "time", "tour_name", "group_name", "round_no")
+DEFAULT_THUMBNAIL_TEMPLATE = {
+    "size": list(THUMBNAIL_SIZE),
+    "layers": [
+        {"type": "background"},
+        {"type": "logo", "x": 960, "y": 40, "anchor": "mt"},
+        {
+            "type": "text",
+            "text": "{team1} vs {team2}",
+            "x": 960,
+            "y": 480,
+            "anchor": "mm",
+            "font_size": 200,
+            "min_font_size": 50,
+            "max_width": 1800,
+            "fill": [255, 255, 255],
+        },
+        {
+            "type": "text",
+            "fields": ["group_name", "round_no"],
+            "separator": " · ",
+            "x": 960,
+            "y": 880,
+            "anchor": "ma",
+            "font_size": 40,
+            "min_font_size": 20,
+            "max_width": 1600,
+            "fill": [220, 220, 220],
+        },
+        {
+            "type": "text",
+            "text": "{time}",
+            "x": 960,
+            "y": 940,
+            "anchor": "ma",
+            "font_size": 30,
+            "min_font_size": 20,
+            "max_width": 1600,
+            "fill": [220, 220, 220],
+        },
+    ],
+}
+THUMBNAIL_FORMATS = {"webp": ("WEBP", "webp"), "jpeg": ("JPEG", "jpg"), "png": ("PNG", "png")}
+THUMBNAIL_FORMAT = os.getenv("THUMBNAIL_FORMAT", "webp").lower()
+if THUMBNAIL_FORMAT not in THUMBNAIL_FORMATS:
+    raise RuntimeError(f"THUMBNAIL_FORMAT must be one of {', '.join(THUMBNAIL_FORMATS)}.")
+THUMBNAIL_OUTPUT_WIDTH = int(os.getenv("THUMBNAIL_OUTPUT_WIDTH", "640"))
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", "85"))
+THUMBNAIL_MIN_QUALITY = 40
+THUMBNAIL_MAX_BYTES = int(os.getenv("THUMBNAIL_MAX_BYTES", str(200 * 1024)))
+THUMBNAIL_FILENAME = f"schedule_thumbnail.{THUMBNAIL_FORMATS[THUMBNAIL_FORMAT][1]}"
+
+
+class FontAssets:
+    def __init__(self, candidates: list[Path], required_glyphs: str) -> None:
+        self.candidates = candidates
+        self.required_glyphs = required_glyphs
+        self.path: Optional[Path] = None
+        self._resolved = False
+        self._fonts: dict[int, ImageFont.FreeTypeFont | ImageFont.ImageFont] = {}
+
+    @staticmethod
+    def _glyph(font: ImageFont.FreeTypeFont, char: str) -> tuple[tuple[int, int], bytes]:
+        mask = font.getmask(char)
+        return mask.size, bytes(mask)
+
+    def validate(self, path: Path) -> bool:
+        if not path.is_file():
+            return False
+        try:
+            font = ImageFont.truetype(str(path), size=32)
+            missing = self._glyph(font, "\U0010ffff")
+            absent = [glyph for glyph in self.required_glyphs if self._glyph(font, glyph) == missing]
+        except Exception:
+            logger.exception("Font %s could not be loaded.", path)
+            return False
+        if absent:
+            logger.warning("Font %s has no glyphs for %r.", path, "".join(absent))
+            return False
+        return True
+
+    def resolve(self) -> Optional[Path]:
+        if self._resolved:
+            return self.path
+        self._fonts.clear()
+        self.path = next((path for path in self.candidates if self.validate(path)), None)
+        self._resolved = True
+        if self.path is None:
+            logger.error(
+                "No usable thumbnail font found in %s; using the default font. Place %s in %s or set THUMBNAIL_FONT_PATH.",
+                ", ".join(str(path) for path in self.candidates),
+                KST_FONT_URL,
+                FONT_DIR,
+            )
+        else:
+            logger.info("Using thumbnail font %s.", self.path)
+        return self.path
+
+    def font(self, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+        font = self._fonts.get(size)
+        if font is not None:
+            return font
+        path = self.resolve()
+        if path is None:
+            font = ImageFont.load_default(size)
+        else:
+            font = ImageFont.truetype(str(path), size=size)
+        self._fonts[size] = font
+        return font
+
+    def preload(self, sizes: Iterable[int]) -> None:
+        for size in sizes:
+            self.font(size)
+
+
+font_assets = FontAssets(
+    [
+        *([Path(THUMBNAIL_FONT_PATH)] if THUMBNAIL_FONT_PATH else []),
+        FONT_DIR / KST_FONT_NAME,
+        DATA_DIR / KST_FONT_NAME,
+    ],
+    "가한A1",
+)
+
+
+@dataclass(frozen=True)
+class ThumbnailLayer:
+    kind: str
+    x: int = 0
+    y: int = 0
+    anchor: str = "la"
+    text: str = ""
+    fields: tuple[str, ...] = ()
+    separator: str = " "
+    font_size: int = 30
+    min_font_size: int = 0
+    max_width: int = 0
+    fill: tuple[int, ...] | str = (255, 255, 255)
+    stroke_width: int = 0
+    stroke_fill: Optional[tuple[int, ...] | str] = None
+    size: Optional[tuple[int, ...]] = None
+
+    @property
+    def referenced_fields(self) -> tuple[str, ...]:
+        if self.fields:
+            return self.fields
+        return tuple(name for _, name, _, _ in string.Formatter().parse(self.text) if name)
+
+    @property
+    def dynamic(self) -> bool:
+        return self.kind == "text" and bool(self.referenced_fields)
+
+    def render_text(self, values: dict[str, str]) -> str:
+        if self.fields:
+            return self.separator.join(value for name in self.fields if (value := values.get(name)))
+        return self.text.format_map(values).strip()
+
+
+@dataclass(frozen=True)
+class ThumbnailTemplate:
+    size: tuple[int, int]
+    layers: tuple[ThumbnailLayer, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ThumbnailTemplate":
+        layers = []
+        for raw in data.get("layers", []):
+            options = {key: tuple(value) if isinstance(value, list) else value for key, value in raw.items()}
+            kind = options.pop("type", None)
+            if kind not in {"background", "logo", "text"}:
+                raise ValueError(f"Unknown thumbnail layer type: {kind}")
+            try:
+                layer = ThumbnailLayer(kind=kind, **options)
+            except TypeError as exc:
+                raise ValueError(f"Invalid {kind} layer: {exc}") from exc
+            if len(layer.anchor) != 2 or layer.anchor[0] not in "lmrs" or layer.anchor[1] not in "atmsbd":
+                raise ValueError(f"Invalid thumbnail layer anchor: {layer.anchor}")
+            unknown = set(layer.referenced_fields) - set(THUMBNAIL_TEXT_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown thumbnail fields: {', '.join(sorted(unknown))}")
+            layers.append(layer)
+        width, height = data.get("size", THUMBNAIL_SIZE)
+        return cls(size=(int(width), int(height)), layers=tuple(layers))
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(sorted({name for layer in self.layers if layer.dynamic for name in layer.referenced_fields}))
+
+    @property
+    def font_sizes(self) -> tuple[int, ...]:
+        return tuple(sorted({layer.font_size for layer in self.layers if layer.kind == "text"}))
+
+
+default_thumbnail_template = ThumbnailTemplate.from_dict(DEFAULT_THUMBNAIL_TEMPLATE)
+
+
+def anchored_position(layer: ThumbnailLayer, size: tuple[int, int]) -> tuple[int, int]:
+    horizontal, vertical = (layer.anchor + "a")[:2]
+    x = layer.x - {"l": 0, "m": size[0] // 2, "r": size[0]}.get(horizontal, 0)
+    y = layer.y - {"m": size[1] // 2, "b": size[1], "d": size[1], "s": size[1]}.get(vertical, 0)
+    return x, y
+
+
+class ThumbnailAssets:
+    def __init__(self, background_dir: Path, template_path: Path, fonts: FontAssets) -> None:
+        self.background_dir = background_dir
+        self.template_path = template_path
+        self.fonts = fonts
+        self._lock = threading.Lock()
+        self._background_listing: Optional[tuple[Optional[float], Optional[Path]]] = None
+        self._background: Optional[tuple[Optional[Path], Optional[float], tuple[int, int], Image.Image]] = None
+        self._template: Optional[tuple[Optional[float], ThumbnailTemplate]] = None
+        self._base: Optional[tuple[tuple, Image.Image]] = None
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[float]:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def background_path(self) -> Optional[Path]:
+        dir_mtime = self._mtime(self.background_dir)
+        listing = self._background_listing
+        if listing is None or listing[0] != dir_mtime:
+            images = []
+            if dir_mtime is not None:
+                images = sorted(
+                    path for path in self.background_dir.iterdir() if path.suffix.lower() in {".png", ".jpg", ".jpeg"}
+                )
+            listing = (dir_mtime, images[0] if images else None)
+            self._background_listing = listing
+        return listing[1]
+
+    def template(self) -> ThumbnailTemplate:
+        mtime = self._mtime(self.template_path)
+        cached = self._template
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        template = default_thumbnail_template
+        if mtime is not None:
+            try:
+                template = ThumbnailTemplate.from_dict(json.loads(self.template_path.read_text(encoding="utf-8")))
+            except (OSError, TypeError, ValueError):
+                logger.exception("Invalid thumbnail template %s; using the default template.", self.template_path)
+        self._template = (mtime, template)
+        return template
+
+    def background(self, size: tuple[int, int] = THUMBNAIL_SIZE) -> Image.Image:
+        path = self.background_path()
+        mtime = self._mtime(path) if path else None
+        with self._lock:
+            cached = self._background
+            if cached is None or cached[0] != path or cached[1] != mtime or cached[2] != size:
+                if path is not None and mtime is not None:
+                    with Image.open(path) as source:
+                        prepared = source.convert("RGB").resize(size)
+                else:
+                    prepared = Image.new("RGB", size, color=(20, 20, 20))
+                cached = (path, mtime, size, prepared)
+                self._background = cached
+        return cached[3].copy()
+
+    def base(self, template: ThumbnailTemplate, tour_logo: Optional[bytes]) -> Image.Image:
+        path = self.background_path()
+        key = (
+            template,
+            path,
+            self._mtime(path) if path else None,
+            self.fonts.path,
+            hashlib.sha256(tour_logo).digest() if tour_logo else None,
+        )
+        cached = self._base
+        if cached is None or cached[0] != key:
+            image = Image.new("RGB", template.size, color=(20, 20, 20))
+            draw = ImageDraw.Draw(image)
+            for layer in template.layers:
+                if layer.kind == "background":
+                    image.paste(self.background(template.size))
+                elif layer.kind == "logo" and tour_logo:
+                    paste_thumbnail_logo(image, layer, tour_logo)
+                elif layer.kind == "text" and not layer.dynamic:
+                    draw_thumbnail_text(draw, layer, layer.text)
+            cached = (key, image)
+            self._base = cached
+        return cached[1].copy()
+
+    def font(self, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+        return self.fonts.font(size)
+
+    def preload(self) -> None:
+        template = self.template()
+        self.fonts.preload(template.font_sizes)
+        self.base(template, None)
+
+
+thumbnail_assets = ThumbnailAssets(BACKGROUND_DIR, THUMBNAIL_TEMPLATE_PATH, font_assets)
+
+
+def fit_thumbnail_font(
+    draw: ImageDraw.ImageDraw,
+    layer: ThumbnailLayer,
+    text: str,
+) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    size = layer.font_size
+    floor = min(layer.min_font_size or size, size)
+    while True:
+        font = thumbnail_assets.font(size)
+        if not layer.max_width or size <= floor:
+            return font
+        left, _, right, _ = draw.textbbox((0, 0), text, font=font, stroke_width=layer.stroke_width)
+        width = right - left
+        if width <= layer.max_width:
+            return font
+        scaled = size * layer.max_width // width // THUMBNAIL_FONT_STEP * THUMBNAIL_FONT_STEP
+        size = max(floor, min(size - THUMBNAIL_FONT_STEP, scaled))
+
+
+def draw_thumbnail_text(draw: ImageDraw.ImageDraw, layer: ThumbnailLayer, text: str) -> None:
+    if not text:
+        return
+    draw.text(
+        (layer.x, layer.y),
+        text,
+        fill=layer.fill,
+        font=fit_thumbnail_font(draw, layer, text),
+        anchor=layer.anchor,
+        stroke_width=layer.stroke_width,
+        stroke_fill=layer.stroke_fill,
+    )
 
 
-def load_kst_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+def paste_thumbnail_logo(image: Image.Image, layer: ThumbnailLayer, tour_logo: bytes) -> None:
     try:
-        if not KST_FONT_PATH.exists():
-            KST_FONT_PATH.parent.mkdir(exist_ok=True)
-            urllib.request.urlretrieve(KST_FONT_URL, KST_FONT_PATH)
-        return ImageFont.truetype(str(KST_FONT_PATH), size=size)
+        with Image.open(io.BytesIO(tour_logo)) as source:
+            logo = source.convert("RGBA")
+        if layer.size:
+            logo.thumbnail(layer.size)
+        image.paste(logo, anchored_position(layer, logo.size), logo)
     except Exception:
-        logger.exception("Failed to load KST font; using default.")
-        return ImageFont.load_default()
+        logger.exception("Failed to draw tour logo for thumbnail")
 
 
 def format_kst_thumbnail_time(details: dict[str, Optional[str]]) -> str:
@@ -545,45 +1747,407 @@ def format_kst_thumbnail_time(details: dict[str, Optional[str]]) -> str:
     return dt_kst.strftime("%Y-%m-%d %H:%M KST")
 
 
-def generate_thumbnail(details: dict[str, Optional[str]]) -> discord.File:
-    background = get_background_image()
-    draw = ImageDraw.Draw(background)
-    font_title = load_kst_font(200)
-    font_subtitle = load_kst_font(30)
+def thumbnail_field_values(details: dict[str, Optional[str]]) -> dict[str, str]:
+    values = {name: details.get(name) or "" for name in THUMBNAIL_TEXT_FIELDS}
+    values["time"] = format_kst_thumbnail_time(details)
+    return values
+
+
+def render_thumbnail(details: dict[str, Optional[str]], tour_logo: Optional[bytes]) -> bytes:
+    template = thumbnail_assets.template()
+    image = thumbnail_assets.base(template, tour_logo)
+    draw = ImageDraw.Draw(image)
+    values = thumbnail_field_values(details)
+    for layer in template.layers:
+        if layer.dynamic:
+            draw_thumbnail_text(draw, layer, layer.render_text(values))
+    return encode_thumbnail(image)
+
+
+def thumbnail_output_size(width: int, size: tuple[int, int]) -> tuple[int, int]:
+    width = max(1, min(width, size[0]))
+    return width, max(1, round(width * size[1] / size[0]))
+
+
+def encode_thumbnail_image(image: Image.Image, quality: int) -> bytes:
+    image_format = THUMBNAIL_FORMATS[THUMBNAIL_FORMAT][0]
+    buffer = io.BytesIO()
+    if image_format == "PNG":
+        colors = max(16, round(256 * quality / 100))
+        image.quantize(colors=colors, method=Image.Quantize.FASTOCTREE).save(buffer, format="PNG", optimize=True)
+    elif image_format == "JPEG":
+        image.save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    return buffer.getvalue()
+
+
+def encode_thumbnail(image: Image.Image) -> bytes:
+    width = THUMBNAIL_OUTPUT_WIDTH
+    while True:
+        size = thumbnail_output_size(width, image.size)
+        resized = image if size == image.size else image.resize(size, Image.Resampling.LANCZOS)
+        quality = THUMBNAIL_QUALITY
+        while True:
+            data = encode_thumbnail_image(resized, quality)
+            if len(data) <= THUMBNAIL_MAX_BYTES or quality <= THUMBNAIL_MIN_QUALITY:
+                break
+            quality = max(THUMBNAIL_MIN_QUALITY, quality - 15)
+        if len(data) <= THUMBNAIL_MAX_BYTES or size[0] <= 320:
+            return data
+        width = size[0] * 3 // 4
 
-    team1 = details.get("team1", "")
-    team2 = details.get("team2", "")
 
-    title_text = f"{team1} vs {team2}".strip()
-    time_text = format_kst_thumbnail_time(details)
+def init_thumbnail_worker() -> None:
+    thumbnail_assets.preload()
 
-    title_box = draw.textbbox((0, 0), title_text, font=font_title)
-    title_width = title_box[2] - title_box[0]
-    title_height = title_box[3] - title_box[1]
-    title_x = (background.width - title_width) // 2
-    title_y = (background.height - title_height) // 2 - 60
-    draw.text((title_x, title_y), title_text, fill=(255, 255, 255), font=font_title)
 
-    time_box = draw.textbbox((0, 0), time_text, font=font_subtitle)
-    time_width = time_box[2] - time_box[0]
-    time_x = (background.width - time_width) // 2
-    time_y = background.height - 140
-    draw.text((time_x, time_y), time_text, fill=(220, 220, 220), font=font_subtitle)
+def warm_thumbnail_worker() -> int:
+    return os.getpid()
 
-    if bot_config.tour_logo:
+
+class ThumbnailRenderPool:
+    def __init__(self, workers: int, queue_limit: int) -> None:
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def start(self) -> None:
+        if self._executor is not None or self.workers <= 0:
+            return
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.info("Process-based thumbnail rendering is unavailable; rendering in a thread.")
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=init_thumbnail_worker,
+        )
+        self._slots = asyncio.Semaphore(self.workers + self.queue_limit)
+        loop = asyncio.get_running_loop()
         try:
-            with urllib.request.urlopen(bot_config.tour_logo) as response:
-                logo = Image.open(io.BytesIO(response.read())).convert("RGBA")
-                logo.thumbnail((300, 300))
-                logo_x = (background.width - logo.width) // 2
-                background.paste(logo, (logo_x, 40), logo)
+            await asyncio.gather(
+                *(loop.run_in_executor(self._executor, warm_thumbnail_worker) for _ in range(self.workers))
+            )
         except Exception:
-            logger.exception("Failed to load tour logo for thumbnail")
+            logger.exception("Failed to start thumbnail workers; rendering in a thread.")
+            self.close()
+
+    async def render(self, details: dict[str, Optional[str]], tour_logo: Optional[bytes]) -> bytes:
+        if self._executor is None or self._slots is None:
+            return await asyncio.to_thread(render_thumbnail, details, tour_logo)
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self._executor, render_thumbnail, dict(details), tour_logo)
+            except BrokenProcessPool:
+                logger.exception("Thumbnail worker pool broke; rendering in a thread.")
+                self.close()
+        return await asyncio.to_thread(render_thumbnail, details, tour_logo)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._slots = None
 
+
+thumbnail_pool = ThumbnailRenderPool(THUMBNAIL_WORKERS, THUMBNAIL_QUEUE_LIMIT)
+
+
+def prepare_tour_logo(raw: bytes) -> bytes:
+    with Image.open(io.BytesIO(raw)) as source:
+        logo = source.convert("RGBA")
+    logo.thumbnail(TOUR_LOGO_SIZE)
     buffer = io.BytesIO()
-    background.save(buffer, format="PNG")
-    buffer.seek(0)
-    return discord.File(fp=buffer, filename="schedule_thumbnail.png")
+    logo.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TourLogoCache:
+    def __init__(self, path: Path, meta_path: Path) -> None:
+        self.path = path
+        self.meta_path = meta_path
+        self.url: Optional[str] = None
+        self.image: Optional[bytes] = None
+        self._task: Optional[asyncio.Task] = None
+        self._task_url: Optional[str] = None
+        self._failed: dict[str, float] = {}
+
+    def load(self) -> bool:
+        if not self.path.exists() or not self.meta_path.exists():
+            return False
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            image = self.path.read_bytes()
+        except (OSError, json.JSONDecodeError):
+            logger.exception("Failed to read cached tour logo.")
+            return False
+        self.url = meta.get("url")
+        self.image = image
+        return True
+
+    def get(self, url: Optional[str]) -> Optional[bytes]:
+        if url and url == self.url:
+            return self.image
+        return None
+
+    def refresh(self, url: str) -> asyncio.Task:
+        if self._task is not None and not self._task.done() and self._task_url == url:
+            return self._task
+        self._failed.pop(url, None)
+        self._task_url = url
+        self._task = asyncio.create_task(self._fetch(url), name="tour-logo-fetch")
+        return self._task
+
+    async def _fetch(self, url: str) -> Optional[bytes]:
+        try:
+            async with bot.challonge.session.get(url) as response:
+                response.raise_for_status()
+                if (response.content_length or 0) > TOUR_LOGO_MAX_BYTES:
+                    raise ValueError("tour logo is too large")
+                raw = await response.content.read(TOUR_LOGO_MAX_BYTES + 1)
+            if len(raw) > TOUR_LOGO_MAX_BYTES:
+                raise ValueError("tour logo is too large")
+            image = await asyncio.to_thread(prepare_tour_logo, raw)
+        except Exception:
+            logger.exception("Failed to fetch tour logo from %s", url)
+            self._failed[url] = time.monotonic()
+            return None
+        self.url = url
+        self.image = image
+        try:
+            await asyncio.to_thread(write_atomic, self.path, image)
+            await asyncio.to_thread(write_atomic, self.meta_path, json.dumps({"url": url}, ensure_ascii=False))
+        except OSError:
+            logger.exception("Failed to store tour logo on disk.")
+        return image
+
+    async def ensure(self, url: Optional[str]) -> Optional[bytes]:
+        if not url:
+            return None
+        cached = self.get(url)
+        if cached is not None:
+            return cached
+        failed_at = self._failed.get(url)
+        if failed_at is not None and time.monotonic() - failed_at < TOUR_LOGO_RETRY_INTERVAL:
+            return None
+        task = self.refresh(url)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=TOUR_LOGO_FETCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Tour logo fetch is slow; rendering without it for now.")
+            return None
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+
+tour_logo_cache = TourLogoCache(TOUR_LOGO_PATH, TOUR_LOGO_META_PATH)
+
+
+def file_fingerprint(path: Optional[Path]) -> str:
+    if path is None:
+        return "-"
+    try:
+        stat = path.stat()
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def thumbnail_cache_key(details: dict[str, Optional[str]], logo: Optional[bytes]) -> str:
+    template = thumbnail_assets.template()
+    values = thumbnail_field_values(details)
+    payload = {
+        "version": THUMBNAIL_RENDER_VERSION,
+        "template": file_fingerprint(thumbnail_assets.template_path),
+        "fields": {name: values[name] for name in template.fields if values[name]},
+        "background": file_fingerprint(thumbnail_assets.background_path()),
+        "logo": hashlib.sha256(logo).hexdigest() if logo else None,
+        "font": file_fingerprint(font_assets.resolve()),
+        "output": [THUMBNAIL_FORMAT, THUMBNAIL_OUTPUT_WIDTH, THUMBNAIL_QUALITY, THUMBNAIL_MAX_BYTES],
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ThumbnailCache:
+    def __init__(self, directory: Path, suffix: str, memory_limit: int, disk_limit: int) -> None:
+        self.directory = directory
+        self.suffix = suffix
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        self.stats: Counter[str] = Counter()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or key in self._disk
+
+    def load(self) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        self._disk.clear()
+        self._disk_bytes = 0
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        return len(self._disk)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        if len(data) > self.memory_limit:
+            return
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.memory_limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _evict_disk(self, keys: list[str]) -> None:
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    async def get(self, key: str) -> Optional[bytes]:
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return data
+        if key not in self._disk:
+            return None
+        data = await asyncio.to_thread(self._read_disk, key)
+        if data is None:
+            self._disk_bytes -= self._disk.pop(key, 0)
+            return None
+        self._disk.move_to_end(key)
+        self.stats["disk_hits"] += 1
+        self._remember(key, data)
+        return data
+
+    async def put(self, key: str, data: bytes) -> None:
+        self._remember(key, data)
+        try:
+            await asyncio.to_thread(write_atomic, self._path(key), data)
+        except OSError:
+            logger.exception("Failed to store thumbnail %s on disk.", key)
+            return
+        self._disk_bytes += len(data) - self._disk.pop(key, 0)
+        self._disk[key] = len(data)
+        evicted = []
+        while self._disk_bytes > self.disk_limit and len(self._disk) > 1:
+            evicted_key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(evicted_key)
+        if evicted:
+            self.stats["evictions"] += len(evicted)
+            await asyncio.to_thread(self._evict_disk, evicted)
+
+    async def get_or_render(self, key: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        data = await self.get(key)
+        if data is not None:
+            return data
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["renders"] += 1
+
+            async def run() -> bytes:
+                try:
+                    rendered = await render()
+                    await self.put(key, rendered)
+                    return rendered
+                finally:
+                    self._inflight.pop(key, None)
+
+            task = asyncio.create_task(run(), name=f"thumbnail-render:{key[:12]}")
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+
+thumbnail_cache = ThumbnailCache(
+    THUMBNAIL_CACHE_DIR,
+    Path(THUMBNAIL_FILENAME).suffix,
+    THUMBNAIL_MEMORY_CACHE_BYTES, THUMBNAIL_DISK_CACHE_BYTES,
+)
+
+
+async def generate_thumbnail(details: dict[str, Optional[str]]) -> discord.File:
+    logo = await tour_logo_cache.ensure(bot_config.tour_logo)
+    key = thumbnail_cache_key(details, logo)
+    data = await thumbnail_cache.get_or_render(key, lambda: thumbnail_pool.render(details, logo))
+    return discord.File(fp=io.BytesIO(data), filename=THUMBNAIL_FILENAME)
+
+
+def bracket_thumbnail_details(
+    bracket: "BracketSnapshot",
+    match: dict,
+    dt_utc: datetime,
+    tour_name: Optional[str] = None,
+    group_name: Optional[str] = None,
+    round_no: Optional[str] = None,
+) -> dict[str, Optional[str]]:
+    return {
+        "team1": bracket.name_by_id.get(match.get("player1_id"), "team1"),
+        "team2": bracket.name_by_id.get(match.get("player2_id"), "team2"),
+        "utc_time": dt_utc.strftime("%Y-%m-%d %H:%M"),
+        "utc_iso": dt_utc.isoformat(),
+        "tour_name": tour_name or "",
+        "group_name": group_name or "",
+        "round_no": round_no or "",
+    }
+
+
+async def prerender_thumbnails(details_list: Iterable[dict[str, Optional[str]]]) -> Counter[str]:
+    logo = await tour_logo_cache.ensure(bot_config.tour_logo)
+    pending: dict[str, dict[str, Optional[str]]] = {}
+    stats: Counter[str] = Counter()
+    for details in details_list:
+        key = thumbnail_cache_key(details, logo)
+        if key in thumbnail_cache or key in pending:
+            stats["cached"] += 1
+        else:
+            pending[key] = details
+
+    async def warm(key: str, details: dict[str, Optional[str]]) -> None:
+        try:
+            await thumbnail_cache.get_or_render(key, lambda: thumbnail_pool.render(details, logo))
+        except Exception:
+            logger.exception("Failed to prerender thumbnail for %s vs %s", details.get("team1"), details.get("team2"))
+            stats["failed"] += 1
+        else:
+            stats["rendered"] += 1
+
+    await asyncio.gather(*(warm(key, details) for key, details in pending.items()))
+    return stats
 
 
 def build_results_embed(title: str, details: dict[str, Optional[str]], event: EventData, result_data: dict[str, str]) -> discord.Embed:
@@ -649,6 +2213,10 @@ class ScheduleView(discord.ui.View):
             return False
         return True
 
+    def resolve_event(self, interaction: discord.Interaction) -> Optional[EventData]:
+        entry = find_event_by_schedule_message_id(interaction.message.id) if interaction.message else None
+        return entry[1] if entry else events_store.get(self.event_title)
+
     async def update_message(self, interaction: discord.Interaction, event: EventData) -> None:
         embed = build_schedule_embed(event.title, event.details, event)
         self.judge_button.style = (
@@ -661,12 +2229,12 @@ class ScheduleView(discord.ui.View):
 
     @discord.ui.button(label="Judge", style=discord.ButtonStyle.danger, emoji="⚖️", custom_id="schedule_judge")
     async def judge_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        event = events_store.get(self.event_title)
+        event = self.resolve_event(interaction)
         if not event:
             await interaction.response.send_message("이벤트를 찾을 수 없어요.")
             return
         event.judge_id = interaction.user.id
-        save_events(events_store)
+        save_event(event, "judge_assign", interaction.user.id)
         if isinstance(interaction.user, discord.Member):
             await add_member_to_event_channel(interaction.user, event)
         await interaction.response.defer()
@@ -674,12 +2242,12 @@ class ScheduleView(discord.ui.View):
 
     @discord.ui.button(label="Recorder", style=discord.ButtonStyle.danger, emoji="🎥", custom_id="schedule_recorder")
     async def recorder_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        event = events_store.get(self.event_title)
+        event = self.resolve_event(interaction)
         if not event:
             await interaction.response.send_message("이벤트를 찾을 수 없어요.")
             return
         event.recorder_id = interaction.user.id
-        save_events(events_store)
+        save_event(event, "recorder_assign", interaction.user.id)
         if isinstance(interaction.user, discord.Member):
             await add_member_to_event_channel(interaction.user, event)
         await interaction.response.defer()
@@ -824,7 +2392,7 @@ async def on_ready() -> None:
     logger.info("Logged in as %s", bot.user)
     for event in events_store.values():
         if event.schedule_message_id:
-            bot.add_view(ScheduleView(event.title))
+            bot.add_view(ScheduleView(event.title), message_id=event.schedule_message_id)
     bot.add_view(TicketPanelView())
     bot.add_view(TicketDeleteView())
 
@@ -891,25 +2459,116 @@ def unique_event_title(team1: str, team2: str, match_id: int) -> str:
     return f"{base} ({match_id})"
 
 
+AutocompleteHandler = Callable[[discord.Interaction, str], Awaitable[list[app_commands.Choice[str]]]]
+
+
+class AutocompleteBudget:
+    def __init__(self, budget: float, recent_limit: int) -> None:
+        self.budget = budget
+        self.recent_limit = recent_limit
+        self.stats: Counter[str] = Counter()
+        self._recent: OrderedDict[tuple[str, str], list[app_commands.Choice[str]]] = OrderedDict()
+        self._background: set[asyncio.Task] = set()
+
+    def _remember(self, name: str, current: str, choices: list[app_commands.Choice[str]]) -> None:
+        key = (name, current.strip().casefold())
+        self._recent[key] = choices
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.recent_limit:
+            self._recent.popitem(last=False)
+
+    def _fallback(self, name: str, current: str) -> Optional[list[app_commands.Choice[str]]]:
+        query = current.strip().casefold()
+        exact = self._recent.get((name, query))
+        if exact is not None:
+            return exact
+        best_query = None
+        for cached_name, cached_query in self._recent:
+            if cached_name == name and query.startswith(cached_query):
+                if best_query is None or len(cached_query) > len(best_query):
+                    best_query = cached_query
+        if best_query is None:
+            return None
+        normalized = normalize_search_text(current)
+        return [
+            choice
+            for choice in self._recent[(name, best_query)]
+            if normalized in normalize_search_text(choice.name)
+        ]
+
+    def wrap(self, handler: AutocompleteHandler) -> AutocompleteHandler:
+        name = handler.__name__
+
+        @functools.wraps(handler)
+        async def wrapper(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+            self.stats["calls"] += 1
+            task = asyncio.create_task(handler(interaction, current), name=f"autocomplete:{name}")
+            try:
+                choices = await asyncio.wait_for(asyncio.shield(task), timeout=self.budget)
+            except asyncio.TimeoutError:
+                self.stats["overruns"] += 1
+                self._background.add(task)
+                task.add_done_callback(lambda done: self._finish_background(name, current, done))
+                fallback = self._fallback(name, current)
+                if fallback is None:
+                    self.stats["misses"] += 1
+                    return []
+                self.stats["fallbacks"] += 1
+                return fallback
+            except Exception:
+                self.stats["errors"] += 1
+                logger.exception("Autocomplete %s failed", name)
+                return self._fallback(name, current) or []
+            self._remember(name, current, choices)
+            return choices
+
+        return wrapper
+
+    def _finish_background(self, name: str, current: str, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if task.cancelled():
+            return
+        if task.exception():
+            self.stats["errors"] += 1
+            logger.warning("Autocomplete %s failed in background: %r", name, task.exception())
+            return
+        self._remember(name, current, task.result())
+
+
+autocomplete_budget = AutocompleteBudget(AUTOCOMPLETE_BUDGET, AUTOCOMPLETE_RECENT_LIMIT)
+
+
+@autocomplete_budget.wrap
 async def autocomplete_challonge_teams(
     interaction: discord.Interaction,
     current: str,
 ) -> list[app_commands.Choice[str]]:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
         return []
-    tournament_url = bot_config.challonge_tournament
-    if not tournament_url:
+    brackets = await load_active_brackets(timeout=AUTOCOMPLETE_BUDGET * 0.75)
+    choices = []
+    seen = set()
+    for _, entry in search_brackets(brackets, current, bracket_team_index):
+        if entry.value in seen:
+            continue
+        seen.add(entry.value)
+        choices.append(app_commands.Choice(name=entry.label, value=entry.value))
+    return choices
+
+
+@autocomplete_budget.wrap
+async def autocomplete_active_tournaments(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice[str]]:
+    if interaction.guild_id != TOURNAMENT_GUILD_ID:
         return []
-    tournament_id = parse_challonge_tournament(tournament_url)
-    participants = await fetch_challonge_participants(tournament_id)
-    names = []
-    for participant in participants:
-        name = participant.get("name") or participant.get("display_name")
-        if name:
-            names.append(name)
     lowered = current.lower()
-    filtered = [name for name in names if not lowered or lowered in name.lower()]
-    return [app_commands.Choice(name=name, value=name) for name in sorted(filtered)[:25]]
+    return [
+        app_commands.Choice(name=tournament_id, value=tournament_id)
+        for tournament_id in active_challonge_tournaments()
+        if not lowered or lowered in tournament_id.lower()
+    ][:25]
 
 
 def should_create_match_channel(match: dict) -> bool:
@@ -936,79 +2595,46 @@ def match_display_name(match: dict, name_by_id: dict[int, str]) -> str:
     return f"{round_label} | {team1} vs {team2} ({state}){match_suffix}"
 
 
+def bracket_match_choice(bracket: "BracketSnapshot", entry: "SearchEntry", multiple: bool) -> app_commands.Choice[str]:
+    display = f"[{bracket.tournament_id}] {entry.label}" if multiple else entry.label
+    return app_commands.Choice(name=display[:100], value=encode_match_choice(bracket.tournament_id, int(entry.value)))
+
+
+def is_schedulable_match_entry(bracket: "BracketSnapshot", entry: "SearchEntry") -> bool:
+    return schedulable_matches.contains(bracket.tournament_id, int(entry.value))
+
+
+@autocomplete_budget.wrap
 async def autocomplete_challonge_matches(
     interaction: discord.Interaction,
     current: str,
 ) -> list[app_commands.Choice[str]]:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
         return []
-    tournament_url = bot_config.challonge_tournament
-    if not tournament_url:
-        return []
-    tournament_id = parse_challonge_tournament(tournament_url)
-    matches = await fetch_challonge_matches(tournament_id)
-    participants = await fetch_challonge_participants(tournament_id)
-    name_by_id = {
-        participant.get("id"): participant.get("name") or participant.get("display_name")
-        for participant in participants
-    }
-    lowered = current.lower()
-    choices = []
-    for match in matches:
-        match_id = match.get("id")
-        player1_id = match.get("player1_id")
-        player2_id = match.get("player2_id")
-        if not match_id or not player1_id or not player2_id:
-            continue
-        display = match_display_name(match, name_by_id)
-        if lowered and lowered not in display.lower():
-            continue
-        choices.append(app_commands.Choice(name=display, value=str(match_id)))
-    return choices[:25]
+    brackets = await load_active_brackets(timeout=AUTOCOMPLETE_BUDGET * 0.75)
+    results = search_brackets(brackets, current, bracket_match_index)
+    return [bracket_match_choice(bracket, entry, len(brackets) > 1) for bracket, entry in results]
 
 
+@autocomplete_budget.wrap
 async def autocomplete_open_challonge_matches(
     interaction: discord.Interaction,
     current: str,
 ) -> list[app_commands.Choice[str]]:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
         return []
-    tournament_url = bot_config.challonge_tournament
-    if not tournament_url:
-        return []
-    tournament_id = parse_challonge_tournament(tournament_url)
-    matches = await fetch_challonge_matches(tournament_id)
-    participants = await fetch_challonge_participants(tournament_id)
-    name_by_id = {
-        participant.get("id"): participant.get("name") or participant.get("display_name")
-        for participant in participants
-    }
-    lowered = current.lower()
-    choices = []
-    for match in matches:
-        match_id = match.get("id")
-        player1_id = match.get("player1_id")
-        player2_id = match.get("player2_id")
-        if not match_id or not player1_id or not player2_id:
-            continue
-        if not should_create_match_channel(match):
-            continue
-        if find_event_by_match_id(str(match_id)):
-            continue
-        display = match_display_name(match, name_by_id)
-        if lowered and lowered not in display.lower():
-            continue
-        choices.append(app_commands.Choice(name=display, value=str(match_id)))
-    return choices[:25]
-
-
-async def autocomplete_event_matches(
-    interaction: discord.Interaction,
-    current: str,
-    *,
-    require_schedule: bool = False,
-) -> list[app_commands.Choice[str]]:
-    if interaction.guild_id != TOURNAMENT_GUILD_ID:
+    brackets = await load_active_brackets(timeout=AUTOCOMPLETE_BUDGET * 0.75)
+    results = search_brackets(brackets, current, bracket_match_index, is_schedulable_match_entry)
+    return [bracket_match_choice(bracket, entry, len(brackets) > 1) for bracket, entry in results]
+
+
+async def autocomplete_event_matches(
+    interaction: discord.Interaction,
+    current: str,
+    *,
+    require_schedule: bool = False,
+) -> list[app_commands.Choice[str]]:
+    if interaction.guild_id != TOURNAMENT_GUILD_ID:
         return []
     lowered = current.lower()
     choices = []
@@ -1025,6 +2651,7 @@ async def autocomplete_event_matches(
     return choices[:25]
 
 
+@autocomplete_budget.wrap
 async def autocomplete_registered_event_matches(
     interaction: discord.Interaction,
     current: str,
@@ -1032,233 +2659,1102 @@ async def autocomplete_registered_event_matches(
     return await autocomplete_event_matches(interaction, current, require_schedule=False)
 
 
-async def autocomplete_scheduled_event_matches(
-    interaction: discord.Interaction,
-    current: str,
-) -> list[app_commands.Choice[str]]:
-    return await autocomplete_event_matches(interaction, current, require_schedule=True)
+@autocomplete_budget.wrap
+async def autocomplete_scheduled_event_matches(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice[str]]:
+    return await autocomplete_event_matches(interaction, current, require_schedule=True)
+
+
+@autocomplete_budget.wrap
+async def autocomplete_staff_resign_roles(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice[str]]:
+    options = ["Judge", "Recorder"]
+    lowered = current.lower()
+    return [
+        app_commands.Choice(name=option, value=option.lower())
+        for option in options
+        if not lowered or lowered in option.lower()
+    ]
+
+
+def is_ticket_channel(channel: discord.abc.GuildChannel) -> bool:
+    return isinstance(channel, discord.TextChannel) and channel.category_id in {
+        OPEN_TICKET_CATEGORY_ID,
+        CLOSED_TICKET_CATEGORY_ID,
+    }
+
+
+def extract_ticket_owner_id(channel: discord.TextChannel) -> Optional[int]:
+    if not channel.topic:
+        return None
+    for chunk in channel.topic.split(";"):
+        part = chunk.strip()
+        if part.startswith("ticket_owner:"):
+            value = part.split("ticket_owner:", 1)[1].strip()
+            return int(value) if value.isdigit() else None
+    return None
+
+
+def extract_ticket_number(channel: discord.TextChannel) -> Optional[int]:
+    if channel.topic:
+        for chunk in channel.topic.split(";"):
+            part = chunk.strip()
+            if part.startswith("ticket_no:"):
+                value = part.split("ticket_no:", 1)[1].strip()
+                return int(value) if value.isdigit() else None
+    match = TICKET_NUMBER_RE.search(channel.name)
+    if match:
+        return int(match.group("number"))
+    return None
+
+
+def find_existing_ticket_channel(
+    guild: discord.Guild,
+    user_id: int,
+) -> Optional[discord.TextChannel]:
+    for channel in guild.channels:
+        if not isinstance(channel, discord.TextChannel):
+            continue
+        if not is_ticket_channel(channel):
+            continue
+        if extract_ticket_owner_id(channel) == user_id:
+            return channel
+    return None
+
+
+def next_ticket_number(guild: discord.Guild) -> int:
+    current = 0
+    for channel in guild.channels:
+        if not isinstance(channel, discord.TextChannel):
+            continue
+        if not is_ticket_channel(channel):
+            continue
+        number = extract_ticket_number(channel)
+        if number and number > current:
+            current = number
+    return current + 1
+
+
+def parse_challonge_tournament(value: str) -> str:
+    trimmed = value.strip()
+    if "challonge.com" not in trimmed:
+        return trimmed
+    match = re.search(r"challonge\.com/(?:tournaments/)?(?P<slug>[\w-]+)", trimmed)
+    if match:
+        return match.group("slug")
+    return trimmed.rsplit("/", 1)[-1]
+
+
+def active_challonge_tournaments() -> list[str]:
+    active: list[str] = []
+    for value in (bot_config.challonge_tournament, *bot_config.challonge_tournaments):
+        if not value:
+            continue
+        tournament_id = parse_challonge_tournament(value)
+        if tournament_id and tournament_id not in active:
+            active.append(tournament_id)
+    return active
+
+
+def add_active_challonge_tournament(value: str) -> bool:
+    if parse_challonge_tournament(value) in active_challonge_tournaments():
+        return False
+    if bot_config.challonge_tournament:
+        bot_config.challonge_tournaments.append(value)
+    else:
+        bot_config.challonge_tournament = value
+    return True
+
+
+def remove_active_challonge_tournament(tournament_id: str) -> bool:
+    remaining = [
+        value for value in bot_config.challonge_tournaments if parse_challonge_tournament(value) != tournament_id
+    ]
+    removed = len(remaining) != len(bot_config.challonge_tournaments)
+    if bot_config.challonge_tournament and parse_challonge_tournament(bot_config.challonge_tournament) == tournament_id:
+        bot_config.challonge_tournament = remaining.pop(0) if remaining else None
+        removed = True
+    bot_config.challonge_tournaments = remaining
+    return removed
+
+
+def resolve_challonge_tournament(value: Optional[str] = None) -> Optional[str]:
+    if value:
+        return parse_challonge_tournament(value)
+    active = active_challonge_tournaments()
+    return active[0] if active else None
+
+
+def encode_match_choice(tournament_id: str, match_id: int) -> str:
+    return f"{tournament_id}:{match_id}"
+
+
+def parse_match_choice(value: str) -> Optional[tuple[str, int]]:
+    tournament_id, _, raw_match_id = value.strip().rpartition(":")
+    try:
+        match_id = int(raw_match_id)
+    except ValueError:
+        return None
+    tournament_id = resolve_challonge_tournament(tournament_id or None)
+    if not tournament_id:
+        return None
+    return tournament_id, match_id
+
+
+def sanitize_channel_name(value: str) -> str:
+    base = re.sub(r"[^a-z0-9가-힣-]+", "-", value.lower()).strip("-")
+    return base or "match"
+
+
+_challonge_cache: dict[str, dict[str, object]] = {}
+_challonge_inflight: dict[str, asyncio.Task] = {}
+
+
+async def get_challonge_token() -> Optional[str]:
+    return await bot.challonge.get_token()
+
+
+async def challonge_request(method: str, path: str, *, params: Optional[dict[str, str]] = None, json_body: Optional[dict] = None) -> Optional[dict]:
+    return await bot.challonge.request(method, path, params=params, json_body=json_body)
+
+
+def normalize_challonge_list(data: object, plural: str, singular: str) -> list[dict]:
+    entries: list
+    if isinstance(data, list):
+        entries = data
+    elif isinstance(data, dict):
+        entries = data.get(plural, [])
+    else:
+        entries = []
+    normalized = []
+    for entry in entries:
+        if isinstance(entry, dict) and singular in entry:
+            normalized.append(entry[singular])
+        else:
+            normalized.append(entry)
+    return normalized
+
+
+def _start_challonge_fetch(
+    cache_key: str,
+    ttl_seconds: float,
+    loader: Callable[[Optional[dict]], Awaitable[Optional[dict]]],
+) -> asyncio.Task:
+    task = _challonge_inflight.get(cache_key)
+    if task is not None:
+        return task
+
+    async def run() -> Optional[list[dict]]:
+        entry = await loader(_challonge_cache.get(cache_key))
+        if entry is None:
+            return None
+        if _challonge_inflight.get(cache_key) is task:
+            fetched_at = datetime.now(timezone.utc)
+            entry["fetched_at"] = fetched_at
+            entry["expires_at"] = fetched_at + timedelta(seconds=ttl_seconds)
+            _challonge_cache[cache_key] = entry
+            challonge_disk_cache.mark_dirty()
+        return entry["data"]
+
+    def on_done(done: asyncio.Task) -> None:
+        if _challonge_inflight.get(cache_key) is done:
+            _challonge_inflight.pop(cache_key, None)
+        if not done.cancelled() and done.exception():
+            logger.warning("Challonge fetch for %s failed: %r", cache_key, done.exception())
+
+    task = asyncio.create_task(run(), name=f"challonge-fetch:{cache_key}")
+    _challonge_inflight[cache_key] = task
+    task.add_done_callback(on_done)
+    return task
+
+
+async def cached_challonge_fetch(
+    cache_key: str,
+    ttl_seconds: float,
+    loader: Callable[[Optional[dict]], Awaitable[Optional[dict]]],
+    *,
+    force: bool = False,
+) -> Optional[list[dict]]:
+    cached = _challonge_cache.get(cache_key)
+    now = datetime.now(timezone.utc)
+    if cached and cached["expires_at"] > now and not force:
+        return cached["data"]
+    if (
+        cached
+        and not force
+        and CHALLONGE_STALE_WHILE_REVALIDATE
+        and (cached.get("warm") or (now - cached["fetched_at"]).total_seconds() <= CHALLONGE_MAX_STALE)
+    ):
+        _start_challonge_fetch(cache_key, ttl_seconds, loader)
+        return cached["data"]
+    task = _start_challonge_fetch(cache_key, ttl_seconds, loader)
+    try:
+        data = await asyncio.shield(task)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        data = None
+    if data is None:
+        return cached["data"] if cached else None
+    return data
+
+
+async def fetch_challonge_collection(
+    tournament_id: str,
+    plural: str,
+    singular: str,
+    ttl_seconds: float,
+    *,
+    force: bool = False,
+) -> Optional[list[dict]]:
+    async def load(previous: Optional[dict]) -> Optional[dict]:
+        response = await bot.challonge.fetch(
+            "GET",
+            f"/tournaments/{tournament_id}/{plural}",
+            etag=previous.get("etag") if previous else None,
+            last_modified=previous.get("last_modified") if previous else None,
+        )
+        if response is None:
+            return None
+        if response.not_modified and previous:
+            return {
+                "data": previous["data"],
+                "etag": response.etag or previous.get("etag"),
+                "last_modified": response.last_modified or previous.get("last_modified"),
+            }
+        if response.data is None:
+            return None
+        return {
+            "data": normalize_challonge_list(response.data, plural, singular),
+            "etag": response.etag,
+            "last_modified": response.last_modified,
+        }
+
+    return await cached_challonge_fetch(f"{tournament_id}:{plural}", ttl_seconds, load, force=force)
+
+
+async def fetch_challonge_participants(tournament_id: str, *, force: bool = False) -> list[dict]:
+    participants = await fetch_challonge_collection(
+        tournament_id, "participants", "participant", CHALLONGE_PARTICIPANTS_TTL, force=force
+    )
+    return participants or []
+
+
+async def fetch_challonge_matches(tournament_id: str, *, force: bool = False) -> list[dict]:
+    matches = await fetch_challonge_collection(tournament_id, "matches", "match", CHALLONGE_MATCHES_TTL, force=force)
+    return matches or []
+
+
+class ChallongeDiskCache:
+    def __init__(self, path: Path, save_delay: float, max_age: float) -> None:
+        self.path = path
+        self.save_delay = save_delay
+        self.max_age = max_age
+        self._save_task: Optional[asyncio.Task] = None
+
+    def load(self) -> int:
+        if not self.path.exists():
+            return 0
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.exception("Failed to read Challonge warm cache.")
+            return 0
+        now = datetime.now(timezone.utc)
+        loaded = 0
+        for cache_key, entry in raw.items():
+            try:
+                fetched_at = datetime.fromisoformat(entry["fetched_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if (now - fetched_at).total_seconds() > self.max_age or cache_key in _challonge_cache:
+                continue
+            _challonge_cache[cache_key] = {
+                "data": entry.get("data", []),
+                "etag": entry.get("etag"),
+                "last_modified": entry.get("last_modified"),
+                "fetched_at": fetched_at,
+                "expires_at": fetched_at,
+                "warm": True,
+            }
+            loaded += 1
+        return loaded
+
+    @staticmethod
+    def _entries() -> list[tuple[str, object, Optional[str], Optional[str], datetime]]:
+        return [
+            (cache_key, entry["data"], entry.get("etag"), entry.get("last_modified"), entry["fetched_at"])
+            for cache_key, entry in _challonge_cache.items()
+        ]
+
+    @staticmethod
+    def _payload(entries: list[tuple[str, object, Optional[str], Optional[str], datetime]]) -> str:
+        payload = {
+            cache_key: {
+                "data": data,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": fetched_at.isoformat(),
+            }
+            for cache_key, data, etag, last_modified, fetched_at in entries
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    def _write(self, entries: list[tuple[str, object, Optional[str], Optional[str], datetime]]) -> None:
+        write_atomic(self.path, self._payload(entries))
+
+    def mark_dirty(self) -> None:
+        if self._save_task and not self._save_task.done():
+            return
+        self._save_task = asyncio.create_task(self._save_later(), name="challonge-cache-save")
+
+    async def _save_later(self) -> None:
+        await asyncio.sleep(self.save_delay)
+        await self.save()
+
+    async def save(self) -> None:
+        try:
+            await asyncio.to_thread(self._write, self._entries())
+        except Exception:
+            logger.exception("Failed to write Challonge warm cache.")
+
+    async def close(self) -> None:
+        if self._save_task and not self._save_task.done():
+            self._save_task.cancel()
+        await self.save()
+
+
+challonge_disk_cache = ChallongeDiskCache(CHALLONGE_CACHE_PATH, CHALLONGE_CACHE_SAVE_DELAY, CHALLONGE_WARM_CACHE_MAX_AGE)
+
+
+def describe_challonge_cache_age(cache_key: str) -> str:
+    cached = _challonge_cache.get(cache_key)
+    if not cached:
+        return "없음"
+    now = datetime.now(timezone.utc)
+    age = int((now - cached["fetched_at"]).total_seconds())
+    state = "fresh" if cached["expires_at"] > now else "stale"
+    if cached.get("warm"):
+        state += " · 디스크"
+    refreshing = " (갱신 중)" if cache_key in _challonge_inflight else ""
+    return f"{age}초 전 · {state}{refreshing}"
+
+
+def invalidate_challonge_cache(cache_key: str) -> None:
+    _challonge_cache.pop(cache_key, None)
+    _challonge_inflight.pop(cache_key, None)
+
+
+def invalidate_challonge_matches(tournament_id: str) -> None:
+    cache_key = f"{tournament_id}:matches"
+    cached = _challonge_cache.get(cache_key)
+    if cached:
+        cached["expires_at"] = cached["fetched_at"]
+    _challonge_inflight.pop(cache_key, None)
+
+
+def invalidate_challonge_tournament(tournament_id: str) -> None:
+    prefix = f"{tournament_id}:"
+    for cache_key in [key for key in (*_challonge_cache, *_challonge_inflight) if key.startswith(prefix)]:
+        invalidate_challonge_cache(cache_key)
+    bracket_poller.snapshots.pop(tournament_id, None)
+    schedulable_matches.by_tournament.pop(tournament_id, None)
+
+
+async def fetch_challonge_match(
+    tournament_id: str,
+    match_id: int,
+) -> Optional[dict]:
+    data = await challonge_request("GET", f"/tournaments/{tournament_id}/matches/{match_id}")
+    if isinstance(data, dict):
+        match = data.get("match", data)
+        if isinstance(match, dict) and match.get("id") == match_id:
+            return match
+    return None
+
+
+async def report_challonge_result(
+    tournament_id: str,
+    match_id: int,
+    winner_id: int,
+    scores_csv: str,
+) -> Optional[ChallongeResponse]:
+    payload = {"match": {"winner_id": winner_id, "scores_csv": scores_csv}}
+    response = await bot.challonge.fetch("PUT", f"/tournaments/{tournament_id}/matches/{match_id}", json_body=payload)
+    if response is not None and response.data:
+        invalidate_challonge_matches(tournament_id)
+        bracket_poller.nudge()
+    return response
+
+def clear_challonge_cache() -> None:
+    _challonge_cache.clear()
+    _challonge_inflight.clear()
+    bot.challonge.reset_token()
+    bracket_poller.snapshots.clear()
+    schedulable_matches.by_tournament.clear()
+    bracket_poller.nudge()
+
+
+def participant_name_map(participants: list[dict]) -> dict[int, str]:
+    return {
+        participant.get("id"): participant.get("name") or participant.get("display_name")
+        for participant in participants
+    }
+
+
+@dataclass
+class BracketSnapshot:
+    tournament_id: str
+    matches: dict[int, dict]
+    participants: list[dict]
+    name_by_id: dict[int, Optional[str]]
+    fetched_at: datetime
+    version: int = 0
+    search: dict[str, "SearchIndex"] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class BracketChange:
+    kind: str
+    tournament_id: str
+    match_id: Optional[int] = None
+    before: Optional[dict] = None
+    after: Optional[dict] = None
+
+
+def has_both_players(match: dict) -> bool:
+    return bool(match.get("player1_id") and match.get("player2_id"))
+
+
+def diff_bracket(before: BracketSnapshot, after: BracketSnapshot) -> list[BracketChange]:
+    changes = []
+    tournament_id = after.tournament_id
+    for match_id, new in after.matches.items():
+        old = before.matches.get(match_id)
+        if old is None:
+            changes.append(BracketChange("match_added", tournament_id, match_id, None, new))
+            continue
+        if old.get("state") != new.get("state"):
+            if new.get("state") == "open":
+                changes.append(BracketChange("match_opened", tournament_id, match_id, old, new))
+            elif new.get("state") == "complete":
+                changes.append(BracketChange("match_completed", tournament_id, match_id, old, new))
+            else:
+                changes.append(BracketChange("match_state_changed", tournament_id, match_id, old, new))
+        if has_both_players(old) and not has_both_players(new):
+            changes.append(BracketChange("players_cleared", tournament_id, match_id, old, new))
+        if has_both_players(new) and (
+            not has_both_players(old)
+            or old.get("player1_id") != new.get("player1_id")
+            or old.get("player2_id") != new.get("player2_id")
+        ):
+            changes.append(BracketChange("players_assigned", tournament_id, match_id, old, new))
+        if (old.get("scores_csv") or "") != (new.get("scores_csv") or ""):
+            changes.append(BracketChange("score_changed", tournament_id, match_id, old, new))
+        if old.get("winner_id") != new.get("winner_id"):
+            changes.append(BracketChange("winner_changed", tournament_id, match_id, old, new))
+        if old.get("round") != new.get("round"):
+            changes.append(BracketChange("round_changed", tournament_id, match_id, old, new))
+    for match_id, old in before.matches.items():
+        if match_id not in after.matches:
+            changes.append(BracketChange("match_removed", tournament_id, match_id, old, None))
+    if before.name_by_id != after.name_by_id:
+        changes.append(BracketChange("participants_changed", tournament_id))
+    return changes
+
+
+BracketHandler = Callable[[BracketChange], Optional[Awaitable[None]]]
+
+
+class BracketPoller:
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.snapshots: dict[str, BracketSnapshot] = {}
+        self._subscribers: dict[str, list[BracketHandler]] = defaultdict(list)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, kind: str, handler: BracketHandler) -> None:
+        self._subscribers[kind].append(handler)
+
+    def nudge(self) -> None:
+        self.interval = self.min_interval
+        if self._wakeup:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="bracket-poller")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self, tournament_id: str, *, force: bool = True) -> tuple[BracketSnapshot, list[BracketChange]]:
+        matches, participants = await asyncio.gather(
+            fetch_challonge_collection(tournament_id, "matches", "match", CHALLONGE_MATCHES_TTL, force=force),
+            fetch_challonge_collection(
+                tournament_id, "participants", "participant", CHALLONGE_PARTICIPANTS_TTL, force=force
+            ),
+        )
+        previous = self.snapshots.get(tournament_id)
+        if matches is None or participants is None:
+            if previous is None:
+                raise RuntimeError(f"Challonge bracket {tournament_id} is unavailable.")
+            logger.warning("Challonge fetch failed for %s; keeping the previous bracket.", tournament_id)
+            return previous, []
+        snapshot = BracketSnapshot(
+            tournament_id=tournament_id,
+            matches={match["id"]: match for match in matches if match.get("id")},
+            participants=participants,
+            name_by_id=participant_name_map(participants),
+            fetched_at=datetime.now(timezone.utc),
+        )
+        if previous is None:
+            await asyncio.to_thread(prepare_bracket_search, snapshot)
+            self.snapshots[tournament_id] = snapshot
+            schedulable_matches.rebuild(snapshot)
+            return snapshot, []
+        changes = diff_bracket(previous, snapshot)
+        if not changes:
+            previous.fetched_at = snapshot.fetched_at
+            return previous, []
+        snapshot.version = previous.version + 1
+        await asyncio.to_thread(prepare_bracket_search, snapshot)
+        self.snapshots[tournament_id] = snapshot
+        await self._dispatch(changes)
+        return snapshot, changes
+
+    async def _dispatch(self, changes: list[BracketChange]) -> None:
+        for change in changes:
+            for handler in (*self._subscribers.get(change.kind, ()), *self._subscribers.get("*", ())):
+                try:
+                    result = handler(change)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception:
+                    logger.exception("Bracket change handler failed for %s", change.kind)
+
+    async def _run(self) -> None:
+        while True:
+            changed = False
+            tournaments = active_challonge_tournaments()
+            results = await asyncio.gather(
+                *(self.refresh(tournament_id) for tournament_id in tournaments),
+                return_exceptions=True,
+            )
+            for tournament_id, result in zip(tournaments, results):
+                if isinstance(result, Exception):
+                    logger.error("Bracket poll failed for %s", tournament_id, exc_info=result)
+                    continue
+                _, changes = result
+                changed = changed or bool(changes)
+            if changed:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.max_interval, self.interval * 1.5)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+def log_bracket_change(change: BracketChange) -> None:
+    logger.info("Bracket %s: %s match=%s", change.tournament_id, change.kind, change.match_id)
+
+
+def is_schedulable_match(match: Optional[dict]) -> bool:
+    if not match or not match.get("id") or not match.get("player1_id") or not match.get("player2_id"):
+        return False
+    return should_create_match_channel(match) and not find_event_by_match_id(str(match["id"]))
+
+
+class SchedulableMatches:
+    def __init__(self) -> None:
+        self.by_tournament: dict[str, set[int]] = {}
+
+    def contains(self, tournament_id: str, match_id: int) -> bool:
+        return match_id in self.by_tournament.get(tournament_id, ())
+
+    def rebuild(self, bracket: BracketSnapshot) -> None:
+        self.by_tournament[bracket.tournament_id] = {
+            match_id for match_id, match in bracket.matches.items() if is_schedulable_match(match)
+        }
+
+    def rebuild_all(self) -> None:
+        for bracket in bracket_poller.snapshots.values():
+            self.rebuild(bracket)
+
+    def refresh_match(self, tournament_id: str, match_id: int) -> None:
+        members = self.by_tournament.get(tournament_id)
+        bracket = bracket_poller.snapshots.get(tournament_id)
+        if members is None or bracket is None:
+            return
+        if is_schedulable_match(bracket.matches.get(match_id)):
+            members.add(match_id)
+        else:
+            members.discard(match_id)
+
+    def refresh_match_ids(self, *raw_match_ids: Optional[str]) -> None:
+        for raw_match_id in {raw for raw in raw_match_ids if raw}:
+            try:
+                match_id = int(raw_match_id)
+            except ValueError:
+                continue
+            for tournament_id in self.by_tournament:
+                self.refresh_match(tournament_id, match_id)
+
+    def apply_change(self, change: BracketChange) -> None:
+        if change.match_id is None:
+            return
+        if change.tournament_id not in self.by_tournament:
+            bracket = bracket_poller.snapshots.get(change.tournament_id)
+            if bracket is not None:
+                self.rebuild(bracket)
+            return
+        self.refresh_match(change.tournament_id, change.match_id)
+
+
+schedulable_matches = SchedulableMatches()
+bracket_poller = BracketPoller(BRACKET_POLL_MIN_INTERVAL, BRACKET_POLL_MAX_INTERVAL)
+bracket_poller.subscribe("*", log_bracket_change)
+bracket_poller.subscribe("*", schedulable_matches.apply_change)
+
+
+async def load_bracket(tournament_id: str) -> BracketSnapshot:
+    snapshot = bracket_poller.snapshots.get(tournament_id)
+    if snapshot is not None:
+        return snapshot
+    snapshot, _ = await bracket_poller.refresh(tournament_id, force=False)
+    return snapshot
 
 
-async def autocomplete_staff_resign_roles(
-    interaction: discord.Interaction,
-    current: str,
-) -> list[app_commands.Choice[str]]:
-    options = ["Judge", "Recorder"]
-    lowered = current.lower()
-    return [
-        app_commands.Choice(name=option, value=option.lower())
-        for option in options
-        if not lowered or lowered in option.lower()
-    ]
+_bracket_loads: dict[str, asyncio.Task] = {}
 
 
-def is_ticket_channel(channel: discord.abc.GuildChannel) -> bool:
-    return isinstance(channel, discord.TextChannel) and channel.category_id in {
-        OPEN_TICKET_CATEGORY_ID,
-        CLOSED_TICKET_CATEGORY_ID,
-    }
+def start_bracket_load(tournament_id: str) -> asyncio.Task:
+    task = _bracket_loads.get(tournament_id)
+    if task is None or task.done():
+        task = asyncio.create_task(load_bracket(tournament_id), name=f"bracket-load:{tournament_id}")
+        task.add_done_callback(lambda done: log_bracket_load_failure(tournament_id, done))
+        _bracket_loads[tournament_id] = task
+    return task
 
 
-def extract_ticket_owner_id(channel: discord.TextChannel) -> Optional[int]:
-    if not channel.topic:
-        return None
-    for chunk in channel.topic.split(";"):
-        part = chunk.strip()
-        if part.startswith("ticket_owner:"):
-            value = part.split("ticket_owner:", 1)[1].strip()
-            return int(value) if value.isdigit() else None
-    return None
+def log_bracket_load_failure(tournament_id: str, task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.error("Failed to load bracket %s", tournament_id, exc_info=task.exception())
 
 
-def extract_ticket_number(channel: discord.TextChannel) -> Optional[int]:
-    if channel.topic:
-        for chunk in channel.topic.split(";"):
-            part = chunk.strip()
-            if part.startswith("ticket_no:"):
-                value = part.split("ticket_no:", 1)[1].strip()
-                return int(value) if value.isdigit() else None
-    match = TICKET_NUMBER_RE.search(channel.name)
-    if match:
-        return int(match.group("number"))
-    return None
+async def load_active_brackets(timeout: Optional[float] = None) -> list[BracketSnapshot]:
+    tournaments = active_challonge_tournaments()
+    loads = {
+        tournament_id: start_bracket_load(tournament_id)
+        for tournament_id in tournaments
+        if tournament_id not in bracket_poller.snapshots
+    }
+    if loads:
+        _, pending = await asyncio.wait(loads.values(), timeout=timeout)
+        if pending:
+            autocomplete_budget.stats["partial"] += 1
+    return [bracket_poller.snapshots[tournament_id] for tournament_id in tournaments if tournament_id in bracket_poller.snapshots]
+
+
+HANGUL_FINAL_TO_INITIAL = str.maketrans(
+    {
+        "\u11a8": "\u1100",
+        "\u11a9": "\u1101",
+        "\u11ab": "\u1102",
+        "\u11ae": "\u1103",
+        "\u11af": "\u1105",
+        "\u11b7": "\u1106",
+        "\u11b8": "\u1107",
+        "\u11ba": "\u1109",
+        "\u11bb": "\u110a",
+        "\u11bc": "\u110b",
+        "\u11bd": "\u110c",
+        "\u11be": "\u110e",
+        "\u11bf": "\u110f",
+        "\u11c0": "\u1110",
+        "\u11c1": "\u1111",
+        "\u11c2": "\u1112",
+    }
+)
+SEARCH_GRAM_SIZE = 3
+SEARCH_FULL_RANK_LIMIT = 512
+AUTOCOMPLETE_LIMIT = 25
 
 
-def find_existing_ticket_channel(
-    guild: discord.Guild,
-    user_id: int,
-) -> Optional[discord.TextChannel]:
-    for channel in guild.channels:
-        if not isinstance(channel, discord.TextChannel):
-            continue
-        if not is_ticket_channel(channel):
-            continue
-        if extract_ticket_owner_id(channel) == user_id:
-            return channel
-    return None
+def is_hangul_initial(char: str) -> bool:
+    return "\u1100" <= char <= "\u1112"
 
 
-def next_ticket_number(guild: discord.Guild) -> int:
-    current = 0
-    for channel in guild.channels:
-        if not isinstance(channel, discord.TextChannel):
-            continue
-        if not is_ticket_channel(channel):
-            continue
-        number = extract_ticket_number(channel)
-        if number and number > current:
-            current = number
-    return current + 1
+def normalize_search_text(value: str) -> str:
+    text = unicodedata.normalize("NFD", unicodedata.normalize("NFKC", value).casefold())
+    return " ".join(text.translate(HANGUL_FINAL_TO_INITIAL).split())
 
 
-def parse_challonge_tournament(value: str) -> str:
-    trimmed = value.strip()
-    if "challonge.com" not in trimmed:
-        return trimmed
-    match = re.search(r"challonge\.com/(?:tournaments/)?(?P<slug>[\w-]+)", trimmed)
-    if match:
-        return match.group("slug")
-    return trimmed.rsplit("/", 1)[-1]
+def hangul_initials(value: str) -> str:
+    decomposed = unicodedata.normalize("NFD", unicodedata.normalize("NFKC", value).casefold())
+    initials = []
+    for index, char in enumerate(decomposed):
+        if is_hangul_initial(char) and index + 1 < len(decomposed) and "\u1161" <= decomposed[index + 1] <= "\u1175":
+            initials.append(char)
+        elif char.isspace():
+            initials.append(" ")
+    return "".join(initials)
 
 
-def sanitize_channel_name(value: str) -> str:
-    base = re.sub(r"[^a-z0-9가-힣-]+", "-", value.lower()).strip("-")
-    return base or "match"
+@dataclass
+class SearchEntry:
+    label: str
+    value: str
+    normalized: str
+    initials: str
+    order: int
+
+
+class SearchIndex:
+    def __init__(self, items: Iterable[tuple[str, str]]) -> None:
+        self.entries: list[SearchEntry] = []
+        self._grams: dict[str, list[int]] = defaultdict(list)
+        self._prefixes: dict[str, list[int]] = defaultdict(list)
+        self._starts: dict[str, list[int]] = defaultdict(list)
+        for label, value in items:
+            order = len(self.entries)
+            normalized = normalize_search_text(label)
+            self.entries.append(SearchEntry(label, value, normalized, hangul_initials(label), order))
+            grams = {
+                normalized[start:start + size]
+                for size in range(1, SEARCH_GRAM_SIZE + 1)
+                for start in range(len(normalized) - size + 1)
+            }
+            for gram in grams:
+                self._grams[gram].append(order)
+            prefixes = {word[:size] for word in normalized.split() for size in range(1, min(len(word), SEARCH_GRAM_SIZE) + 1)}
+            for prefix in prefixes:
+                self._prefixes[prefix].append(order)
+            for size in range(1, min(len(normalized), SEARCH_GRAM_SIZE) + 1):
+                self._starts[normalized[:size]].append(order)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _rank(self, entry: SearchEntry, query: str, first_token: str) -> int:
+        if entry.normalized.startswith(query):
+            return 0
+        if any(word.startswith(first_token) for word in entry.normalized.split()):
+            return 1
+        return 2
+
+    def _selective_postings(self, tokens: list[str]) -> list[int]:
+        best: Optional[list[int]] = None
+        for token in tokens:
+            grams = [token] if len(token) <= SEARCH_GRAM_SIZE else [
+                token[start:start + SEARCH_GRAM_SIZE] for start in range(len(token) - SEARCH_GRAM_SIZE + 1)
+            ]
+            for gram in grams:
+                posting = self._grams.get(gram, [])
+                if best is None or len(posting) < len(best):
+                    best = posting
+        return best or []
+
+    def _ranked(self, query: str) -> Iterable[tuple[int, SearchEntry]]:
+        if not query:
+            for entry in self.entries:
+                yield 0, entry
+            return
+        if all(is_hangul_initial(char) for char in query.replace(" ", "")):
+            for entry in self.entries:
+                if query in entry.initials:
+                    yield (0 if entry.initials.startswith(query) else 2), entry
+            return
+        tokens = query.split()
+        first_token = tokens[0]
+        candidates = self._selective_postings(tokens)
+        if len(candidates) <= SEARCH_FULL_RANK_LIMIT:
+            ranked = [
+                (self._rank(entry, query, first_token), entry)
+                for entry in (self.entries[order] for order in candidates)
+                if all(token in entry.normalized for token in tokens)
+            ]
+            ranked.sort(key=lambda item: (item[0], item[1].order))
+            yield from ranked
+            return
+        seen: set[int] = set()
+        tiers = (
+            (0, self._starts.get(query[:SEARCH_GRAM_SIZE], [])),
+            (1, self._prefixes.get(first_token[:SEARCH_GRAM_SIZE], [])),
+            (2, candidates),
+        )
+        for tier, postings in tiers:
+            for order in postings:
+                if order in seen:
+                    continue
+                entry = self.entries[order]
+                if not all(token in entry.normalized for token in tokens):
+                    continue
+                if self._rank(entry, query, first_token) != tier:
+                    continue
+                seen.add(order)
+                yield tier, entry
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = AUTOCOMPLETE_LIMIT,
+        predicate: Optional[Callable[[SearchEntry], bool]] = None,
+    ) -> list[tuple[int, SearchEntry]]:
+        results = []
+        for rank, entry in self._ranked(normalize_search_text(query)):
+            if predicate is not None and not predicate(entry):
+                continue
+            results.append((rank, entry))
+            if len(results) >= limit:
+                break
+        return results
+
+
+def bracket_team_index(bracket: BracketSnapshot) -> SearchIndex:
+    index = bracket.search.get("teams")
+    if index is None:
+        names = sorted({name for name in bracket.name_by_id.values() if name})
+        index = SearchIndex((name, name) for name in names)
+        bracket.search["teams"] = index
+    return index
+
+
+def bracket_match_index(bracket: BracketSnapshot) -> SearchIndex:
+    index = bracket.search.get("matches")
+    if index is None:
+        index = SearchIndex(
+            (match_display_name(match, bracket.name_by_id), str(match["id"]))
+            for match in bracket.matches.values()
+            if match.get("id") and match.get("player1_id") and match.get("player2_id")
+        )
+        bracket.search["matches"] = index
+    return index
 
 
-_challonge_token: Optional[str] = None
-_challonge_token_expiry: Optional[datetime] = None
-_challonge_cache: dict[str, dict[str, object]] = {}
+def prepare_bracket_search(bracket: BracketSnapshot) -> None:
+    bracket_team_index(bracket)
+    bracket_match_index(bracket)
 
 
-async def get_challonge_token() -> Optional[str]:
-    global _challonge_token, _challonge_token_expiry
-    if not CHALLONGE_CLIENT_SECRET or not CHALLONGE_CLIENT_ID:
-        return None
-    if _challonge_token and _challonge_token_expiry:
-        if datetime.now(timezone.utc) < _challonge_token_expiry:
-            return _challonge_token
-    payload = {
-        "grant_type": "client_credentials",
-        "client_id": CHALLONGE_CLIENT_ID,
-        "client_secret": CHALLONGE_CLIENT_SECRET,
-    }
-    timeout = aiohttp.ClientTimeout(total=15)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(CHALLONGE_TOKEN_URL, data=payload) as response:
-            if response.status >= 400:
-                body = await response.text()
-                logger.error("Failed to fetch Challonge token: %s %s", response.status, body)
-                return None
-            data = await response.json()
-    token = data.get("access_token")
-    expires_in = int(data.get("expires_in", 3600))
-    if token:
-        _challonge_token = token
-        _challonge_token_expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in - 30)
-    return token
+def search_brackets(
+    brackets: list[BracketSnapshot],
+    query: str,
+    index_for: Callable[[BracketSnapshot], SearchIndex],
+    predicate: Optional[Callable[[BracketSnapshot, SearchEntry], bool]] = None,
+) -> list[tuple[BracketSnapshot, SearchEntry]]:
+    ranked = []
+    for position, bracket in enumerate(brackets):
+        bracket_predicate = (lambda entry, bracket=bracket: predicate(bracket, entry)) if predicate else None
+        for rank, entry in index_for(bracket).search(query, predicate=bracket_predicate):
+            ranked.append((rank, entry.order, position, bracket, entry))
+    ranked.sort(key=lambda item: item[:3])
+    return [(bracket, entry) for _, _, _, bracket, entry in ranked[:AUTOCOMPLETE_LIMIT]]
 
 
-async def challonge_request(method: str, path: str, *, params: Optional[dict[str, str]] = None, json_body: Optional[dict] = None) -> Optional[dict]:
-    headers = {}
-    params = params.copy() if params else {}
-    if CHALLONGE_API_KEY:
-        params["api_key"] = CHALLONGE_API_KEY
-        params.setdefault("format", "json")
-    else:
-        token = await get_challonge_token()
-        if not token:
-            logger.warning("Challonge token unavailable.")
-            return None
-        headers["Authorization"] = f"Bearer {token}"
-        headers["Accept"] = "application/json"
-    url = f"{CHALLONGE_API_BASE}{path}"
-    timeout = aiohttp.ClientTimeout(total=20)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.request(method, url, headers=headers, params=params, json=json_body) as response:
-            if response.status >= 400:
-                body = await response.text()
-                logger.error("Challonge request failed %s %s: %s", method, url, body)
-                return None
-            try:
-                return await response.json(content_type=None)
-            except aiohttp.ContentTypeError:
-                body = await response.text()
-                logger.error("Challonge returned non-JSON payload: %s", body)
-                return None
+@dataclass
+class OutboxItem:
+    match_id: int
+    tournament_id: str
+    winner_id: int
+    scores_csv: str
+    status: str
+    attempts: int
+    last_error: Optional[str]
+    updated_at: str
+    next_attempt_at: str
+
+
+class ChallongeOutbox:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                match_id INTEGER PRIMARY KEY,
+                tournament_id TEXT NOT NULL,
+                winner_id INTEGER NOT NULL,
+                scores_csv TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                next_attempt_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at)")
+        self._conn.commit()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, tournament_id: str, match_id: int, winner_id: int, scores_csv: str) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO outbox (
+                    match_id, tournament_id, winner_id, scores_csv, status, attempts,
+                    last_error, created_at, updated_at, next_attempt_at
+                ) VALUES (?, ?, ?, ?, 'pending', 0, NULL, ?, ?, ?)
+                ON CONFLICT(match_id) DO UPDATE SET
+                    tournament_id = excluded.tournament_id,
+                    winner_id = excluded.winner_id,
+                    scores_csv = excluded.scores_csv,
+                    status = 'pending',
+                    attempts = 0,
+                    last_error = NULL,
+                    updated_at = excluded.updated_at,
+                    next_attempt_at = excluded.next_attempt_at
+                """,
+                (match_id, tournament_id, winner_id, scores_csv, now, now, now),
+            )
+        if self._wakeup:
+            self._wakeup.set()
 
+    def _select(self, where: str, params: tuple = (), limit: Optional[int] = None) -> list[OutboxItem]:
+        query = (
+            "SELECT match_id, tournament_id, winner_id, scores_csv, status, attempts, last_error, "
+            f"updated_at, next_attempt_at FROM outbox WHERE {where} ORDER BY next_attempt_at"
+        )
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [OutboxItem(*row) for row in rows]
+
+    def due_items(self) -> list[OutboxItem]:
+        now = datetime.now(timezone.utc).isoformat()
+        return self._select("status = 'pending' AND next_attempt_at <= ?", (now,))
+
+    def next_due_at(self) -> Optional[datetime]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'"
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def open_items(self, limit: int = 25) -> list[OutboxItem]:
+        return self._select("status IN ('pending', 'failed')", limit=limit)
+
+    def mark_done(self, item: OutboxItem) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'done', attempts = attempts + 1, last_error = NULL, updated_at = ? "
+                "WHERE match_id = ? AND updated_at = ?",
+                (now, item.match_id, item.updated_at),
+            )
 
-async def fetch_challonge_participants(tournament_id: str) -> list[dict]:
-    cache_key = f"{tournament_id}:participants"
-    cached = _challonge_cache.get(cache_key)
-    now = datetime.now(timezone.utc)
-    if cached and isinstance(cached.get("expires_at"), datetime) and cached["expires_at"] > now:
-        return cached.get("data", [])
-    data = await challonge_request("GET", f"/tournaments/{tournament_id}/participants")
-    participants: list[dict]
-    if isinstance(data, list):
-        participants = data
-    elif isinstance(data, dict):
-        participants = data.get("participants", [])
-    else:
-        participants = []
-    normalized = []
-    for entry in participants:
-        if isinstance(entry, dict) and "participant" in entry:
-            normalized.append(entry["participant"])
-        else:
-            normalized.append(entry)
-    participants = normalized
-    _challonge_cache[cache_key] = {
-        "data": participants,
-        "expires_at": now + timedelta(minutes=5),
-    }
-    return participants
+    def mark_failed_attempt(self, item: OutboxItem, error: str) -> None:
+        attempts = item.attempts + 1
+        now = datetime.now(timezone.utc)
+        status = "failed" if attempts >= OUTBOX_MAX_ATTEMPTS else "pending"
+        next_attempt = now + timedelta(seconds=min(3600, 30 * (2 ** (attempts - 1))))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, updated_at = ?, next_attempt_at = ? "
+                "WHERE match_id = ? AND updated_at = ?",
+                (status, attempts, error, now.isoformat(), next_attempt.isoformat(), item.match_id, item.updated_at),
+            )
 
+    def mark_rejected(self, item: OutboxItem, error: str) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'failed', attempts = attempts + 1, last_error = ?, updated_at = ? "
+                "WHERE match_id = ? AND updated_at = ?",
+                (error, now, item.match_id, item.updated_at),
+            )
 
-async def fetch_challonge_matches(tournament_id: str) -> list[dict]:
-    data = await challonge_request("GET", f"/tournaments/{tournament_id}/matches")
-    matches: list[dict]
-    if isinstance(data, list):
-        matches = data
-    elif isinstance(data, dict):
-        matches = data.get("matches", [])
-    else:
-        matches = []
-    normalized = []
-    for entry in matches:
-        if isinstance(entry, dict) and "match" in entry:
-            normalized.append(entry["match"])
-        else:
-            normalized.append(entry)
-    return normalized
+    def retry_failed(self) -> int:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE outbox SET status = 'pending', attempts = 0, updated_at = ?, next_attempt_at = ? "
+                "WHERE status = 'failed'",
+                (now, now),
+            )
+        if self._wakeup:
+            self._wakeup.set()
+        return cursor.rowcount
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="challonge-outbox")
 
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
 
-async def fetch_challonge_match(
-    tournament_id: str,
-    match_id: int,
-) -> Optional[dict]:
-    matches = await fetch_challonge_matches(tournament_id)
-    for match in matches:
-        if match.get("id") == match_id:
-            return match
-    return None
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
+    async def process_due(self) -> None:
+        for item in await asyncio.to_thread(self.due_items):
+            try:
+                response = await report_challonge_result(item.tournament_id, item.match_id, item.winner_id, item.scores_csv)
+                error = None if response is not None and response.data else "Challonge did not answer the update"
+            except Exception as exc:
+                response = None
+                error = repr(exc)
+            if error is None:
+                await asyncio.to_thread(self.mark_done, item)
+                logger.info("Synced Challonge result for match %s", item.match_id)
+            elif response is not None and response.rejected:
+                await asyncio.to_thread(self.mark_rejected, item, f"{response.status}: {response.error or ''}")
+                logger.error("Challonge rejected result for match %s: %s", item.match_id, response.error)
+            else:
+                await asyncio.to_thread(self.mark_failed_attempt, item, error)
+                logger.warning("Failed to sync Challonge match %s (attempt %s): %s", item.match_id, item.attempts + 1, error)
 
-async def report_challonge_result(
-    tournament_id: str,
-    match_id: int,
-    winner_id: int,
-    scores_csv: str,
-) -> bool:
-    payload = {"match": {"winner_id": winner_id, "scores_csv": scores_csv}}
-    data = await challonge_request("PUT", f"/tournaments/{tournament_id}/matches/{match_id}", json_body=payload)
-    return bool(data)
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.process_due()
+            except Exception:
+                logger.exception("Challonge outbox worker failed.")
+            next_due = await asyncio.to_thread(self.next_due_at)
+            timeout = OUTBOX_POLL_INTERVAL
+            if next_due:
+                timeout = min(timeout, max(0.0, (next_due - datetime.now(timezone.utc)).total_seconds()))
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
 
-def clear_challonge_cache() -> None:
-    _challonge_cache.clear()
-    global _challonge_token, _challonge_token_expiry
-    _challonge_token = None
-    _challonge_token_expiry = None
+
+challonge_outbox = ChallongeOutbox(OUTBOX_DB_PATH)
 
 def allow_ticket_admins(
     guild: discord.Guild,
@@ -1473,12 +3969,21 @@ async def send_interaction_message(
         logger.warning("Failed to send interaction response because the interaction expired.")
 
 
+def _lookup_indexed_event(title: Optional[str]) -> Optional[tuple[str, EventData]]:
+    if title is None:
+        return None
+    event = events_store.get(title)
+    if event is None:
+        return None
+    return title, event
+
+
 def find_event_by_match_id(match_id: str) -> Optional[tuple[str, EventData]]:
-    for title, event in events_store.items():
-        stored_match_id = event.details.get("challonge_match_id") if event.details else None
-        if stored_match_id and stored_match_id == match_id:
-            return title, event
-    return None
+    return _lookup_indexed_event(event_index.by_match_id.get(match_id))
+
+
+def find_event_by_schedule_message_id(message_id: int) -> Optional[tuple[str, EventData]]:
+    return _lookup_indexed_event(event_index.by_schedule_message_id.get(message_id))
 
 
 @config_group.command(name="set", description="토너먼트 봇 사전설정을 저장합니다.")
@@ -1532,8 +4037,10 @@ async def config_set(
         bot_config.thumbnail_channel = thumbnail_channel.id
     if tour_logo:
         bot_config.tour_logo = tour_logo
+        tour_logo_cache.refresh(tour_logo)
     if challonge_tournament:
         bot_config.challonge_tournament = challonge_tournament
+        bracket_poller.nudge()
 
     save_config(bot_config)
     await interaction.response.send_message("설정을 저장했습니다.")
@@ -1563,6 +4070,11 @@ async def config_show(interaction: discord.Interaction) -> None:
         value=bot_config.challonge_tournament or "미설정",
         inline=False,
     )
+    embed.add_field(
+        name="challonge_tournaments",
+        value=", ".join(bot_config.challonge_tournaments) or "미설정",
+        inline=False,
+    )
     await interaction.response.send_message(embed=embed)
 
 
@@ -1614,17 +4126,16 @@ async def events_create(
     if not bot_config.schedule_channel:
         await interaction.response.send_message("schedule_channel 설정이 필요합니다.")
         return
-    if not bot_config.challonge_tournament:
+    if not active_challonge_tournaments():
         await interaction.response.send_message("challonge_tournament 설정이 필요합니다.")
         return
 
     await interaction.response.defer()
-    tournament_id = parse_challonge_tournament(bot_config.challonge_tournament)
-    try:
-        match_id = int(match)
-    except ValueError:
+    match_choice = parse_match_choice(match)
+    if match_choice is None:
         await send_interaction_message(interaction, "유효한 매치를 선택해 주세요.")
         return
+    tournament_id, match_id = match_choice
     match_data = await fetch_challonge_match(tournament_id, match_id)
     if not match_data:
         await send_interaction_message(interaction, "챌론지 매치를 찾을 수 없어요.")
@@ -1667,6 +4178,7 @@ async def events_create(
         "image_url": image_url or "",
         "remarks": remarks or "",
         "challonge_match_id": str(match_id),
+        "challonge_tournament_id": tournament_id,
         "challonge_player1_id": str(player1_id),
         "challonge_player2_id": str(player2_id),
     }
@@ -1685,9 +4197,9 @@ async def events_create(
         return
 
     view = ScheduleView(title)
-    thumbnail_file = generate_thumbnail(details)
+    thumbnail_file = await generate_thumbnail(details)
     embed = build_schedule_embed(title, details, event)
-    embed.set_thumbnail(url="attachment://schedule_thumbnail.png")
+    embed.set_thumbnail(url=f"attachment://{THUMBNAIL_FILENAME}")
     message = await schedule_channel.send(embed=embed, view=view, file=thumbnail_file)
     event.schedule_message_id = message.id
     event.schedule_channel_id = schedule_channel.id
@@ -1699,7 +4211,7 @@ async def events_create(
         channel=channel,
     )
     events_store[title] = event
-    save_events(events_store)
+    save_event(event, "create", interaction.user.id)
     log_schedule_action("create", user=interaction.user, event=event)
 
     response = "이벤트를 생성했습니다."
@@ -1798,7 +4310,7 @@ async def events_edit(
         event.recorder_id = recorder.id
 
     event.details = details
-    save_events(events_store)
+    save_event(event, "edit", interaction.user.id)
 
     await interaction.response.defer()
 
@@ -1808,9 +4320,9 @@ async def events_edit(
         if isinstance(channel_obj, discord.TextChannel):
             try:
                 message = await channel_obj.fetch_message(event.schedule_message_id)
-                thumbnail_file = generate_thumbnail(details)
+                thumbnail_file = await generate_thumbnail(details)
                 embed = build_schedule_embed(event.title, details, event)
-                embed.set_thumbnail(url="attachment://schedule_thumbnail.png")
+                embed.set_thumbnail(url=f"attachment://{THUMBNAIL_FILENAME}")
                 await message.edit(embed=embed, view=ScheduleView(event.title), attachments=[thumbnail_file])
             except discord.NotFound:
                 pass
@@ -1824,6 +4336,7 @@ async def events_edit(
             details=details,
             channel=channel,
         )
+        save_event(event, "scheduled_event_sync", interaction.user.id)
 
     changes = []
     all_keys = set(before_details.keys()) | set(details.keys())
@@ -1863,7 +4376,7 @@ async def events_delete(interaction: discord.Interaction, match: str, reason: Op
     event_title, event = event_entry
     events_store.pop(event_title, None)
 
-    save_events(events_store)
+    delete_event(event_title, interaction.user.id)
     log_schedule_action("delete", user=interaction.user, event=event, changes=[f"reason: {reason or '없음'}"])
     if event.schedule_channel_id and event.schedule_message_id:
         tournament_guild = get_tournament_guild()
@@ -1933,12 +4446,90 @@ async def events_show(
     if not event_data.schedule_message_id:
         await interaction.response.send_message("스케줄이 생성된 이벤트만 표시할 수 있어요.")
         return
-    thumbnail_file = generate_thumbnail(event_data.details)
+    thumbnail_file = await generate_thumbnail(event_data.details)
     embed = build_schedule_embed(event_data.title, event_data.details, event_data)
-    embed.set_thumbnail(url="attachment://schedule_thumbnail.png")
+    embed.set_thumbnail(url=f"attachment://{THUMBNAIL_FILENAME}")
     await interaction.response.send_message(embed=embed, file=thumbnail_file)
 
 
+@events_group.command(name="prerender", description="썸네일을 미리 렌더링합니다.")
+@app_commands.describe(
+    dd="일 (입력 시 열린 챌론지 매치를 렌더링)",
+    mm="월",
+    yyyy="연도",
+    hour="시",
+    minute="분",
+    tournament="챌론지 토너먼트",
+    tour_name="토너먼트 이름",
+    group_name="그룹",
+    round_no="라운드",
+)
+@app_commands.autocomplete(tournament=autocomplete_active_tournaments)
+async def events_prerender(
+    interaction: discord.Interaction,
+    dd: Optional[int] = None,
+    mm: Optional[int] = None,
+    yyyy: Optional[int] = None,
+    hour: Optional[int] = None,
+    minute: Optional[int] = None,
+    tournament: Optional[str] = None,
+    tour_name: Optional[str] = None,
+    group_name: Optional[str] = None,
+    round_no: Optional[str] = None,
+) -> None:
+    if interaction.guild_id != TOURNAMENT_GUILD_ID:
+        await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
+        return
+    if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
+        await interaction.response.send_message("권한이 없습니다.")
+        return
+    time_parts = (dd, mm, yyyy, hour, minute)
+    if any(part is not None for part in time_parts) and any(part is None for part in time_parts):
+        await interaction.response.send_message("일정을 지정하려면 일/월/연도/시/분을 모두 입력해 주세요.")
+        return
+    tournament_id = parse_challonge_tournament(tournament) if tournament else None
+
+    await interaction.response.defer()
+    started = time.monotonic()
+    if dd is None:
+        details_list = [
+            event.details
+            for event in events_store.values()
+            if event.details and (not tournament_id or event.details.get("challonge_tournament_id") == tournament_id)
+        ]
+    else:
+        try:
+            dt_utc = datetime(yyyy, mm, dd, hour, minute, tzinfo=timezone.utc)
+        except ValueError:
+            await send_interaction_message(interaction, "유효한 일정을 입력해 주세요.")
+            return
+        tournaments = [tournament_id] if tournament_id else active_challonge_tournaments()
+        if not tournaments:
+            await send_interaction_message(interaction, "challonge_tournament 설정이 필요합니다.")
+            return
+        brackets = await asyncio.gather(*(load_bracket(tid) for tid in tournaments), return_exceptions=True)
+        details_list = []
+        for tid, bracket in zip(tournaments, brackets):
+            if isinstance(bracket, BaseException):
+                logger.error("Failed to load bracket %s for prerender: %s", tid, bracket)
+                continue
+            for match_id in sorted(schedulable_matches.by_tournament.get(tid, ())):
+                match_data = bracket.matches.get(match_id)
+                if match_data:
+                    details_list.append(
+                        bracket_thumbnail_details(bracket, match_data, dt_utc, tour_name, group_name, round_no)
+                    )
+    if not details_list:
+        await send_interaction_message(interaction, "렌더링할 매치가 없습니다.")
+        return
+    stats = await prerender_thumbnails(details_list)
+    elapsed = time.monotonic() - started
+    response = f"썸네일 {stats['rendered']}개를 렌더링했습니다. (캐시 {stats['cached']}개, {elapsed:.1f}초)"
+    if stats["failed"]:
+        response += f" 실패 {stats['failed']}개"
+    await send_interaction_message(interaction, response)
+
+
 @events_group.command(name="results", description="토너먼트 결과를 등록합니다.")
 @app_commands.describe(
     event="챌론지 매치",
@@ -2027,9 +4618,10 @@ async def events_results(
     embed = build_results_embed(event_data.title, event_data.details, event_data, result_payload)
     await results_channel.send(embed=embed)
     event_data.details["result_recorded_at"] = datetime.now(timezone.utc).isoformat()
-    save_events(events_store)
+    save_event(event_data, "result_recorded", interaction.user.id)
     match_id_raw = event_data.details.get("challonge_match_id") if event_data.details else None
-    if match_id_raw and bot_config.challonge_tournament:
+    tournament_id = (event_data.details.get("challonge_tournament_id") if event_data.details else None) or resolve_challonge_tournament()
+    if match_id_raw and tournament_id:
         try:
             match_id = int(match_id_raw)
             player1_id = int(event_data.details.get("challonge_player1_id") or 0)
@@ -2042,11 +4634,8 @@ async def events_results(
             else:
                 winner_id = player1_id if team1_score_int > team2_score_int else player2_id
             scores_csv = f"{team1_score_int}-{team2_score_int}"
-            tournament_id = parse_challonge_tournament(bot_config.challonge_tournament)
             if winner_id:
-                updated = await report_challonge_result(tournament_id, match_id, winner_id, scores_csv)
-                if not updated:
-                    logger.warning("Failed to update Challonge match %s", match_id)
+                await asyncio.to_thread(challonge_outbox.enqueue, tournament_id, match_id, winner_id, scores_csv)
         except (ValueError, TypeError):
             logger.warning("Invalid Challonge match data; skipping auto update.")
     await interaction.response.send_message("결과를 등록했습니다.")
@@ -2086,16 +4675,16 @@ async def events_staff_resign(
         await interaction.response.send_message("role 파라미터는 judge 또는 recorder 이어야 합니다.")
         return
 
-    save_events(events_store)
+    save_event(event, f"{role_key}_resign", interaction.user.id)
     if event.schedule_channel_id and event.schedule_message_id:
         tournament_guild = get_tournament_guild()
         channel_obj = tournament_guild.get_channel(event.schedule_channel_id) if tournament_guild else None
         if isinstance(channel_obj, discord.TextChannel):
             try:
                 message = await channel_obj.fetch_message(event.schedule_message_id)
-                thumbnail_file = generate_thumbnail(event.details)
+                thumbnail_file = await generate_thumbnail(event.details)
                 embed = build_schedule_embed(event.title, event.details, event)
-                embed.set_thumbnail(url="attachment://schedule_thumbnail.png")
+                embed.set_thumbnail(url=f"attachment://{THUMBNAIL_FILENAME}")
                 await message.edit(embed=embed, view=ScheduleView(event.title), attachments=[thumbnail_file])
             except discord.NotFound:
                 pass
@@ -2111,9 +4700,17 @@ async def events_reset_tournament(interaction: discord.Interaction) -> None:
     if not isinstance(interaction.user, discord.Member) or not has_tournament_edit_role(interaction.user):
         await interaction.response.send_message("권한이 없습니다.")
         return
+    await interaction.response.defer()
+    label = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    try:
+        archive_path = await persistence.archive(label)
+    except Exception:
+        logger.exception("Failed to archive tournament events before reset.")
+        await send_interaction_message(interaction, "이벤트 보관에 실패하여 초기화를 취소했습니다.")
+        return
     events_store.clear()
-    save_events(events_store)
-    await interaction.response.send_message("토너먼트 정보를 초기화했습니다.")
+    save_events()
+    await send_interaction_message(interaction, f"토너먼트 정보를 초기화했습니다. (보관: {archive_path.name})")
 
 
 @general_group.command(name="add_to_channel", description="멤버 또는 역할에 채널 권한을 부여합니다.")
@@ -2328,8 +4925,9 @@ async def channel_create(
     if not created:
         await interaction.followup.send("생성할 매치 채널이 없습니다.", ephemeral=True)
         return
-    bot_config.challonge_tournament = challonge_link
-    save_config(bot_config)
+    if add_active_challonge_tournament(challonge_link):
+        save_config(bot_config)
+        bracket_poller.nudge()
     await interaction.followup.send(
         f"매치 채널 {len(created)}개를 생성했습니다.",
         ephemeral=True,
@@ -2337,10 +4935,12 @@ async def channel_create(
 
 
 @challonge_group.command(name="create", description="챌론지 매치 기반 채널을 생성합니다.")
-@app_commands.describe(category="채널을 만들 카테고리")
+@app_commands.describe(category="채널을 만들 카테고리", tournament="대상 토너먼트 (기본: 첫 번째 활성 토너먼트)")
+@app_commands.autocomplete(tournament=autocomplete_active_tournaments)
 async def challonge_create(
     interaction: discord.Interaction,
     category: Optional[discord.CategoryChannel] = None,
+    tournament: Optional[str] = None,
 ) -> None:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
         await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
@@ -2348,14 +4948,14 @@ async def challonge_create(
     if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
         await interaction.response.send_message("권한이 없습니다.")
         return
-    if not bot_config.challonge_tournament:
+    tournament_id = resolve_challonge_tournament(tournament)
+    if not tournament_id:
         await interaction.response.send_message("challonge_tournament 설정이 필요합니다.")
         return
     if not CHALLONGE_API_KEY and (not CHALLONGE_CLIENT_SECRET or not CHALLONGE_CLIENT_ID):
         await interaction.response.send_message("CHALLONGE_API_KEY 또는 CHALLONGE_CLIENT_ID/SECRET 환경 변수가 필요합니다.")
         return
     await interaction.response.defer()
-    tournament_id = parse_challonge_tournament(bot_config.challonge_tournament)
     target_category = category or (
         interaction.channel.category if isinstance(interaction.channel, discord.TextChannel) else None
     )
@@ -2406,12 +5006,53 @@ async def challonge_set(
             return
     bot_config.challonge_tournament = tournament
     save_config(bot_config)
+    bracket_poller.nudge()
     message = "챌론지 토너먼트를 설정했습니다."
     if captains_csv:
         message += " (팀장 CSV를 저장했습니다.)"
     await interaction.response.send_message(message)
 
 
+@challonge_group.command(name="add", description="활성 챌론지 토너먼트를 추가합니다.")
+@app_commands.describe(tournament="Challonge 토너먼트 링크 또는 ID")
+async def challonge_add(interaction: discord.Interaction, tournament: str) -> None:
+    if interaction.guild_id != TOURNAMENT_GUILD_ID:
+        await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
+        return
+    if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
+        await interaction.response.send_message("권한이 없습니다.")
+        return
+    if not add_active_challonge_tournament(tournament):
+        await interaction.response.send_message("이미 활성화된 토너먼트입니다.")
+        return
+    save_config(bot_config)
+    bracket_poller.nudge()
+    await interaction.response.send_message(
+        f"토너먼트를 추가했습니다. (활성: {', '.join(active_challonge_tournaments())})"
+    )
+
+
+@challonge_group.command(name="remove", description="활성 챌론지 토너먼트를 제거합니다.")
+@app_commands.describe(tournament="제거할 토너먼트")
+@app_commands.autocomplete(tournament=autocomplete_active_tournaments)
+async def challonge_remove(interaction: discord.Interaction, tournament: str) -> None:
+    if interaction.guild_id != TOURNAMENT_GUILD_ID:
+        await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
+        return
+    if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
+        await interaction.response.send_message("권한이 없습니다.")
+        return
+    tournament_id = parse_challonge_tournament(tournament)
+    if not remove_active_challonge_tournament(tournament_id):
+        await interaction.response.send_message("활성 토너먼트 목록에 없습니다.")
+        return
+    save_config(bot_config)
+    invalidate_challonge_tournament(tournament_id)
+    await interaction.response.send_message(
+        f"토너먼트를 제거했습니다. (활성: {', '.join(active_challonge_tournaments()) or '없음'})"
+    )
+
+
 @challonge_group.command(name="info", description="챌론지 연동 상태를 확인합니다.")
 async def challonge_info(interaction: discord.Interaction) -> None:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
@@ -2421,7 +5062,8 @@ async def challonge_info(interaction: discord.Interaction) -> None:
         await interaction.response.send_message("권한이 없습니다.")
         return
     embed = discord.Embed(title="챌론지 연동 상태", color=discord.Color.blurple())
-    embed.add_field(name="tournament", value=bot_config.challonge_tournament or "미설정", inline=False)
+    tournaments = active_challonge_tournaments()
+    embed.add_field(name="tournaments", value=", ".join(tournaments) or "미설정", inline=False)
     embed.add_field(
         name="client_secret",
         value="설정됨" if CHALLONGE_CLIENT_SECRET else "미설정",
@@ -2437,25 +5079,55 @@ async def challonge_info(interaction: discord.Interaction) -> None:
         value="설정됨" if CHALLONGE_API_KEY else "미설정",
         inline=False,
     )
+    stats = bot.challonge.stats
+    embed.add_field(
+        name="requests",
+        value=(
+            f"요청 {stats['requests']} · 재시도 {stats['retries']} · 429 {stats['throttled']} · "
+            f"대기 {stats['limiter_waits']} · 오류 {stats['errors']} · 실패 {stats['failures']}"
+        ),
+        inline=False,
+    )
+    autocomplete_stats = autocomplete_budget.stats
+    embed.add_field(
+        name="autocomplete",
+        value=(
+            f"호출 {autocomplete_stats['calls']} · 초과 {autocomplete_stats['overruns']} · "
+            f"캐시 응답 {autocomplete_stats['fallbacks']} · 미스 {autocomplete_stats['misses']} · "
+            f"부분 {autocomplete_stats['partial']} · 오류 {autocomplete_stats['errors']}"
+        ),
+        inline=False,
+    )
+    for tournament_id in tournaments:
+        embed.add_field(
+            name=f"{tournament_id} cache",
+            value=(
+                f"participants: {describe_challonge_cache_age(f'{tournament_id}:participants')}\n"
+                f"matches: {describe_challonge_cache_age(f'{tournament_id}:matches')}"
+            ),
+            inline=False,
+        )
     await interaction.response.send_message(embed=embed)
 
 
 @challonge_group.command(name="participants", description="챌론지 참가 팀 목록을 확인합니다.")
-async def challonge_participants(interaction: discord.Interaction) -> None:
+@app_commands.describe(tournament="대상 토너먼트 (기본: 첫 번째 활성 토너먼트)")
+@app_commands.autocomplete(tournament=autocomplete_active_tournaments)
+async def challonge_participants(interaction: discord.Interaction, tournament: Optional[str] = None) -> None:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
         await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
         return
     if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
         await interaction.response.send_message("권한이 없습니다.")
         return
-    if not bot_config.challonge_tournament:
+    tournament_id = resolve_challonge_tournament(tournament)
+    if not tournament_id:
         await interaction.response.send_message("challonge_tournament 설정이 필요합니다.")
         return
     if not CHALLONGE_API_KEY and (not CHALLONGE_CLIENT_SECRET or not CHALLONGE_CLIENT_ID):
         await interaction.response.send_message("CHALLONGE_API_KEY 또는 CHALLONGE_CLIENT_ID/SECRET 환경 변수가 필요합니다.")
         return
     await interaction.response.defer()
-    tournament_id = parse_challonge_tournament(bot_config.challonge_tournament)
     participants = await fetch_challonge_participants(tournament_id)
     if not participants:
         await interaction.followup.send("참가 팀을 찾을 수 없어요.")
@@ -2478,21 +5150,23 @@ async def challonge_participants(interaction: discord.Interaction) -> None:
 
 
 @challonge_group.command(name="matches", description="챌론지 매치 목록을 확인합니다.")
-async def challonge_matches(interaction: discord.Interaction) -> None:
+@app_commands.describe(tournament="대상 토너먼트 (기본: 첫 번째 활성 토너먼트)")
+@app_commands.autocomplete(tournament=autocomplete_active_tournaments)
+async def challonge_matches(interaction: discord.Interaction, tournament: Optional[str] = None) -> None:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
         await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
         return
     if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
         await interaction.response.send_message("권한이 없습니다.")
         return
-    if not bot_config.challonge_tournament:
+    tournament_id = resolve_challonge_tournament(tournament)
+    if not tournament_id:
         await interaction.response.send_message("challonge_tournament 설정이 필요합니다.")
         return
     if not CHALLONGE_API_KEY and (not CHALLONGE_CLIENT_SECRET or not CHALLONGE_CLIENT_ID):
         await interaction.response.send_message("CHALLONGE_API_KEY 또는 CHALLONGE_CLIENT_ID/SECRET 환경 변수가 필요합니다.")
         return
     await interaction.response.defer()
-    tournament_id = parse_challonge_tournament(bot_config.challonge_tournament)
     matches = await fetch_challonge_matches(tournament_id)
     if not matches:
         await interaction.followup.send("매치 정보를 찾을 수 없어요.")
@@ -2523,6 +5197,35 @@ async def challonge_matches(interaction: discord.Interaction) -> None:
     await interaction.followup.send(embed=embed)
 
 
+@challonge_group.command(name="outbox", description="챌론지 결과 동기화 대기열을 확인합니다.")
+@app_commands.describe(retry_failed="실패한 항목을 다시 시도")
+async def challonge_outbox_command(interaction: discord.Interaction, retry_failed: bool = False) -> None:
+    if interaction.guild_id != TOURNAMENT_GUILD_ID:
+        await interaction.response.send_message("이 명령은 토너먼트 서버에서만 사용할 수 있어요.")
+        return
+    if not isinstance(interaction.user, discord.Member) or not has_op_role(interaction.user):
+        await interaction.response.send_message("권한이 없습니다.")
+        return
+    requeued = await asyncio.to_thread(challonge_outbox.retry_failed) if retry_failed else 0
+    items = await asyncio.to_thread(challonge_outbox.open_items)
+    lines = []
+    for item in items:
+        event_entry = find_event_by_match_id(str(item.match_id))
+        label = event_entry[0] if event_entry else f"#{item.match_id}"
+        line = f"- [{item.status}] {label} ({item.scores_csv}) 시도 {item.attempts}회"
+        if item.last_error:
+            line += f" · {item.last_error[:80]}"
+        lines.append(line)
+    embed = discord.Embed(
+        title="챌론지 결과 동기화 대기열",
+        description="\n".join(lines) or "대기 중인 항목이 없습니다.",
+        color=discord.Color.blurple(),
+    )
+    if requeued:
+        embed.set_footer(text=f"실패 항목 {requeued}개를 다시 대기열에 넣었습니다.")
+    await interaction.response.send_message(embed=embed)
+
+
 @challonge_group.command(name="refresh", description="챌론지 캐시를 초기화합니다.")
 async def challonge_refresh(interaction: discord.Interaction) -> None:
     if interaction.guild_id != TOURNAMENT_GUILD_ID:
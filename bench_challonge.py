@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from fake_challonge import FakeChallonge, FaultConfig, start_fake_challonge
+
+
+class BenchCategory:
+    def __init__(self) -> None:
+        self.channels: list = []
+
+
+class BenchChannel(SimpleNamespace):
+    pass
+
+
+class BenchRole:
+    def __init__(self, role_id: int) -> None:
+        self.id = role_id
+
+
+class BenchGuild:
+    def __init__(self, guild_id: int) -> None:
+        self.id = guild_id
+        self.default_role = BenchRole(guild_id)
+        self.created = 0
+
+    def get_role(self, role_id: int):
+        return None
+
+    async def create_text_channel(self, name: str, **kwargs) -> BenchChannel:
+        self.created += 1
+        return BenchChannel(name=name, guild=self, **kwargs)
+
+
+def percentile(samples: list[float], ratio: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> str:
+    return (
+        f"p50 {statistics.median(samples) * 1000:7.2f}ms  "
+        f"p95 {percentile(samples, 0.95) * 1000:7.2f}ms  "
+        f"max {max(samples) * 1000:7.2f}ms"
+    )
+
+
+async def bench_autocomplete(app, interaction, queries: list[str], rounds: int) -> dict[str, list[float]]:
+    handlers = {
+        "teams": app.autocomplete_challonge_teams,
+        "matches": app.autocomplete_challonge_matches,
+        "open_matches": app.autocomplete_open_challonge_matches,
+    }
+    results = {}
+    for label, handler in handlers.items():
+        samples = []
+        for _ in range(rounds):
+            for query in queries:
+                started = time.perf_counter()
+                await handler(interaction, query)
+                samples.append(time.perf_counter() - started)
+        results[label] = samples
+    return results
+
+
+async def bench_size(app, server: FakeChallonge, teams: int, args) -> None:
+    slug = f"bench{teams}"
+    server.add_tournament(slug, teams, completed_ratio=args.completed_ratio)
+    app.clear_challonge_cache()
+    app.bot_config.challonge_tournament = slug
+    interaction = SimpleNamespace(guild_id=app.TOURNAMENT_GUILD_ID)
+
+    started = time.perf_counter()
+    await app.load_bracket(slug)
+    cold = time.perf_counter() - started
+
+    queries = ["", "t", "team 0", "team 00", "r1", "vs team 0001", "zzz"]
+    autocomplete = await bench_autocomplete(app, interaction, queries, args.rounds)
+
+    guild = BenchGuild(app.TOURNAMENT_GUILD_ID)
+    started = time.perf_counter()
+    created = await app.build_challonge_match_channels(guild, BenchCategory(), slug)
+    build = time.perf_counter() - started
+    throughput = len(created) / build if build else float("inf")
+
+    print(f"[{teams:4d} teams] cold bracket load {cold * 1000:8.2f}ms")
+    for label, samples in autocomplete.items():
+        print(f"             autocomplete {label:<12} {summarize(samples)}")
+    print(f"             channel build {len(created):4d} channels in {build * 1000:8.2f}ms ({throughput:,.0f}/s)")
+
+
+async def run(args) -> None:
+    server = FakeChallonge(
+        FaultConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            rate_429=args.rate_429,
+            rate_5xx=args.rate_5xx,
+            retry_after=0.05,
+        )
+    )
+    runner, base_url = await start_fake_challonge(server)
+    os.environ["CHALLONGE_API_BASE"] = base_url
+    os.environ.setdefault("CHALLONGE_API_KEY", "bench")
+    os.environ.setdefault("DISCORD_BOT_TOKEN", "bench")
+    os.environ.setdefault("SKIP_PACKAGE_INSTALL", "1")
+    os.environ.setdefault("TOURNAMENT_DATA_DIR", tempfile.mkdtemp(prefix="tournament-bench-"))
+
+    import app
+
+    await app.bot.challonge.open()
+    try:
+        for teams in args.teams:
+            await bench_size(app, server, teams, args)
+        print(f"client stats: {dict(app.bot.challonge.stats)}")
+        print(f"server requests: {server.requests}")
+    finally:
+        await app.bot.challonge.close()
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Challonge-backed autocomplete and channel builds against a local stand-in.")
+    parser.add_argument("--teams", type=int, nargs="+", default=[16, 64, 256, 1024])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--completed-ratio", type=float, default=0.25)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from aiohttp import web
+
+
+@dataclass
+class FaultConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    retry_after: float = 1.0
+
+
+@dataclass
+class FakeTournament:
+    slug: str
+    participants: dict[int, dict] = field(default_factory=dict)
+    matches: dict[int, dict] = field(default_factory=dict)
+    version: int = 0
+
+    def etag(self, resource: str) -> str:
+        digest = hashlib.sha1(f"{self.slug}:{resource}:{self.version}".encode("utf-8")).hexdigest()
+        return f'"{digest[:16]}"'
+
+
+def generate_tournament(slug: str, teams: int, *, completed_ratio: float = 0.0, seed: int = 0) -> FakeTournament:
+    rng = random.Random(seed)
+    tournament = FakeTournament(slug=slug)
+    now = datetime.now(timezone.utc).isoformat()
+    for index in range(teams):
+        participant_id = 1000 + index
+        tournament.participants[participant_id] = {
+            "id": participant_id,
+            "name": f"Team {index + 1:04d}",
+            "display_name": f"Team {index + 1:04d}",
+            "seed": index + 1,
+            "created_at": now,
+        }
+    next_match_id = 50000
+    current_round = list(tournament.participants)
+    round_no = 1
+    while len(current_round) > 1:
+        next_round = []
+        for index in range(0, len(current_round) - 1, 2):
+            player1_id = current_round[index] if round_no == 1 else None
+            player2_id = current_round[index + 1] if round_no == 1 else None
+            match = {
+                "id": next_match_id,
+                "round": round_no,
+                "identifier": f"M{next_match_id - 49999}",
+                "state": "open" if round_no == 1 else "pending",
+                "player1_id": player1_id,
+                "player2_id": player2_id,
+                "winner_id": None,
+                "loser_id": None,
+                "scores_csv": "",
+                "updated_at": now,
+            }
+            tournament.matches[next_match_id] = match
+            next_round.append(next_match_id)
+            next_match_id += 1
+        if len(current_round) % 2:
+            next_round.append(None)
+        current_round = next_round
+        round_no += 1
+    opening = [match for match in tournament.matches.values() if match["round"] == 1]
+    for match in rng.sample(opening, int(len(opening) * completed_ratio)):
+        winner = match["player1_id"] if rng.random() < 0.5 else match["player2_id"]
+        complete_match(tournament, match, winner, "2-1" if winner == match["player1_id"] else "1-2")
+    return tournament
+
+
+def complete_match(tournament: FakeTournament, match: dict, winner_id: int, scores_csv: str) -> None:
+    match["winner_id"] = winner_id
+    match["loser_id"] = match["player2_id"] if winner_id == match["player1_id"] else match["player1_id"]
+    match["scores_csv"] = scores_csv
+    match["state"] = "complete"
+    match["updated_at"] = datetime.now(timezone.utc).isoformat()
+    next_round = [other for other in tournament.matches.values() if other["round"] == match["round"] + 1]
+    same_round = sorted(other["id"] for other in tournament.matches.values() if other["round"] == match["round"])
+    position = same_round.index(match["id"])
+    if position // 2 < len(next_round):
+        target = sorted(next_round, key=lambda other: other["id"])[position // 2]
+        slot = "player1_id" if position % 2 == 0 else "player2_id"
+        target[slot] = winner_id
+        if target["player1_id"] and target["player2_id"]:
+            target["state"] = "open"
+    tournament.version += 1
+
+
+class FakeChallonge:
+    def __init__(self, faults: Optional[FaultConfig] = None, seed: int = 0) -> None:
+        self.faults = faults or FaultConfig()
+        self.tournaments: dict[str, FakeTournament] = {}
+        self.requests: dict[str, int] = {}
+        self._rng = random.Random(seed)
+
+    def add_tournament(self, slug: str, teams: int, *, completed_ratio: float = 0.0) -> FakeTournament:
+        tournament = generate_tournament(slug, teams, completed_ratio=completed_ratio, seed=len(self.tournaments))
+        self.tournaments[slug] = tournament
+        return tournament
+
+    def _tournament(self, request: web.Request) -> FakeTournament:
+        slug = request.match_info["tournament"].removesuffix(".json")
+        tournament = self.tournaments.get(slug)
+        if tournament is None:
+            raise web.HTTPNotFound(text=json.dumps({"errors": ["Tournament not found"]}), content_type="application/json")
+        return tournament
+
+    @web.middleware
+    async def fault_middleware(self, request: web.Request, handler):
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        key = f"{request.method} {route}"
+        self.requests[key] = self.requests.get(key, 0) + 1
+        delay = self.faults.latency_ms + self._rng.uniform(0, self.faults.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        roll = self._rng.random()
+        if roll < self.faults.rate_429:
+            return web.json_response(
+                {"errors": ["Rate limit exceeded"]},
+                status=429,
+                headers={"Retry-After": str(self.faults.retry_after)},
+            )
+        if roll < self.faults.rate_429 + self.faults.rate_5xx:
+            return web.json_response({"errors": ["Upstream failure"]}, status=self._rng.choice([500, 502, 503]))
+        return await handler(request)
+
+    def _list_response(self, request: web.Request, tournament: FakeTournament, resource: str, payload: list) -> web.Response:
+        etag = tournament.etag(resource)
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(payload, headers={"ETag": etag})
+
+    async def list_participants(self, request: web.Request) -> web.Response:
+        tournament = self._tournament(request)
+        payload = [{"participant": participant} for participant in tournament.participants.values()]
+        return self._list_response(request, tournament, "participants", payload)
+
+    async def list_matches(self, request: web.Request) -> web.Response:
+        tournament = self._tournament(request)
+        payload = [{"match": match} for match in tournament.matches.values()]
+        return self._list_response(request, tournament, "matches", payload)
+
+    def _match(self, request: web.Request, tournament: FakeTournament) -> dict:
+        try:
+            match_id = int(request.match_info["match_id"].removesuffix(".json"))
+        except ValueError:
+            raise web.HTTPNotFound()
+        match = tournament.matches.get(match_id)
+        if match is None:
+            raise web.HTTPNotFound(text=json.dumps({"errors": ["Match not found"]}), content_type="application/json")
+        return match
+
+    async def show_match(self, request: web.Request) -> web.Response:
+        tournament = self._tournament(request)
+        return web.json_response({"match": self._match(request, tournament)})
+
+    async def update_match(self, request: web.Request) -> web.Response:
+        tournament = self._tournament(request)
+        match = self._match(request, tournament)
+        body = await request.json()
+        update = body.get("match", {})
+        winner_id = update.get("winner_id")
+        if winner_id not in {match["player1_id"], match["player2_id"]} or not winner_id:
+            return web.json_response({"errors": ["Winner must be a player of this match"]}, status=422)
+        complete_match(tournament, match, winner_id, update.get("scores_csv", ""))
+        return web.json_response({"match": match})
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.fault_middleware])
+        app.router.add_get("/tournaments/{tournament}/participants", self.list_participants)
+        app.router.add_get("/tournaments/{tournament}/participants.json", self.list_participants)
+        app.router.add_get("/tournaments/{tournament}/matches", self.list_matches)
+        app.router.add_get("/tournaments/{tournament}/matches.json", self.list_matches)
+        app.router.add_get("/tournaments/{tournament}/matches/{match_id}", self.show_match)
+        app.router.add_put("/tournaments/{tournament}/matches/{match_id}", self.update_match)
+        return app
+
+
+async def start_fake_challonge(
+    server: FakeChallonge,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> tuple[web.AppRunner, str]:
+    runner = web.AppRunner(server.create_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Challonge API stand-in for development and benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--tournament", default="fake")
+    parser.add_argument("--teams", type=int, default=64)
+    parser.add_argument("--completed-ratio", type=float, default=0.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeChallonge(
+        FaultConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            rate_429=args.rate_429,
+            rate_5xx=args.rate_5xx,
+        )
+    )
+    server.add_tournament(args.tournament, args.teams, completed_ratio=args.completed_ratio)
+    print(f"CHALLONGE_API_BASE=http://{args.host}:{args.port}  tournament={args.tournament}  teams={args.teams}")
+    web.run_app(server.create_app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()